@@ -0,0 +1,219 @@
+"""
+Headless benchmarks for the checkers engine, printed as JSON so
+results can be compared between releases.
+
+    python -m CheckersAI.benchmark perft --depth 6
+    python -m CheckersAI.benchmark selfplay --games 10 --depth 5
+
+from the Checkers directory.
+
+perft counts the leaf positions reachable from the starting board at
+every depth up to --depth, timing move generation alone. selfplay has
+the AI play against itself, after a few random opening moves so the
+games differ, and reports search and game throughput. selfplay --stats
+adds search counters totalled over every move, and --profile writes a
+folded stacks file for a flame graph of either benchmark. selfplay
+--processes N searches on N worker processes with ParallelSearch and
+reports each worker's nodes per second next to the total, to measure
+the speedup over --processes 0, the single-process search. selfplay
+also reports the transposition tables' hits, misses, hit rate, stores
+and overwrites under "table", per game and in total.
+"""
+import argparse
+import json
+import platform
+import random
+import time
+from pycheckers.constants import RED, WHITE
+from pycheckers.board import Board
+from pycheckers.bitboard import BitBoard
+from .minimax.algorithm import Search, get_all_move_tuples
+from .minimax.transposition import TranspositionTable
+from .minimax.stats import SearchStats
+from .minimax.profiler import SamplingProfiler
+from .minimax.parallel import ParallelSearch
+
+BOARDS = {'board': Board, 'bitboard': BitBoard}
+MAX_PLIES = 200 # Self-play games still going after this many moves are scored as draws
+
+def perft(board, depth, color):
+    """Function to count the positions reachable in exactly depth moves"""
+    if depth == 0:
+        return 1
+    next_color = WHITE if color == RED else RED
+    nodes = 0
+    for piece, move, skip in get_all_move_tuples(board, color):
+        undo = board.make_move(piece, move[0], move[1], skip)
+        nodes += perft(board, depth - 1, next_color)
+        board.undo_move(undo)
+    return nodes
+
+def runPerft(board_class, depth):
+    """Function to time perft at every depth from 1 to depth, red moving first as in a real game"""
+    results = []
+    for current_depth in range(1, depth + 1):
+        board = board_class()
+        start = time.perf_counter()
+        nodes = perft(board, current_depth, RED)
+        seconds = time.perf_counter() - start
+        results.append({'depth': current_depth, 'nodes': nodes, 'seconds': seconds, 'nodes_per_second': nodes / seconds if seconds else 0.0})
+    return {'benchmark': 'perft', 'depths': results}
+
+def playGame(board_class, depth, random_plies, rng, table_size, quiescence=False, totals=None, parallel=None, workers=None):
+    """
+    Function to play one AI-vs-AI game, returning its winner, length and per-depth search totals, adding search stats to totals if given.
+    With a ParallelSearch every search runs on its processes and each worker's moves, nodes and seconds are added to workers.
+    """
+    board = board_class()
+    color = RED
+    tables = {RED: TranspositionTable(table_size), WHITE: TranspositionTable(table_size)} if table_size else {RED: None, WHITE: None}
+    plies = nodes = 0
+    seconds = 0.0
+    winner = None
+    while plies < MAX_PLIES:
+        winner = board.declareWinner()
+        if winner != None:
+            break
+        move_tuples = get_all_move_tuples(board, color)
+        if not move_tuples:
+            winner = WHITE if color == RED else RED # Blocked side loses
+            break
+        if plies < random_plies:
+            move = rng.choice(move_tuples)
+        elif parallel is not None:
+            start = time.perf_counter()
+            value, board, stats = parallel.search(board, depth, color == WHITE)
+            seconds += time.perf_counter() - start
+            nodes += stats['nodes']
+            if totals is not None:
+                addStats(totals, stats['search'])
+            for pid, worker in stats['workers'].items():
+                total = workers.setdefault(pid, {'moves': 0, 'nodes': 0, 'seconds': 0.0})
+                for name in ('moves', 'nodes', 'seconds'):
+                    total[name] += worker[name]
+                total['table'] = worker['table']
+            color = WHITE if color == RED else RED
+            plies += 1
+            continue # The parallel search returns a new board with its move made
+        else:
+            search = Search(None, tables[color], quiescence=quiescence, stats=SearchStats() if totals is not None else None)
+            start = time.perf_counter()
+            value, move, index = search.root(board, depth, color == WHITE)
+            seconds += time.perf_counter() - start
+            nodes += search.nodes
+            if totals is not None:
+                addStats(totals, search.stats)
+        piece, destination, skip = move
+        board.make_move(piece, destination[0], destination[1], skip)
+        color = WHITE if color == RED else RED
+        plies += 1
+    result = {'winner': 'red' if winner == RED else 'white' if winner == WHITE else 'draw', 'plies': plies, 'nodes': nodes, 'search_seconds': seconds}
+    if parallel is None and table_size:
+        result['table'] = addTableStats([table.stats() for table in tables.values()])
+    return result
+
+def addTableStats(table_stats):
+    """Function to add up the counters of several transposition tables, giving the hit rate of them all"""
+    total = {name: sum(stats[name] for stats in table_stats) for name in ('hits', 'misses', 'stores', 'overwrites')}
+    probes = total['hits'] + total['misses']
+    total['hit_rate'] = total['hits'] / probes if probes else 0.0
+    return total
+
+def addStats(totals, stats):
+    """Function to add one search's SearchStats to running totals"""
+    stats.finish()
+    for name, value in stats.toDict().items():
+        if name == 'branching_factor':
+            continue
+        if name in ('depth', 'max_ply'):
+            totals[name] = max(totals.get(name, 0), value)
+        elif name not in ('aborted', 'nodes_per_second'):
+            totals[name] = totals.get(name, 0) + value
+    for name, counts in (('ply_nodes', stats.ply_nodes), ('ply_moves', stats.ply_moves)):
+        total = totals.setdefault(name, [])
+        total.extend([0] * (len(counts) - len(total)))
+        for ply, count in enumerate(counts):
+            total[ply] += count
+
+def summarizeStats(totals):
+    """Function to turn stats totals into the report, with the branching factor at each ply"""
+    summary = {name: value for name, value in totals.items() if name not in ('ply_nodes', 'ply_moves')}
+    summary['branching_factor'] = [moves / nodes if nodes else 0.0 for nodes, moves in zip(totals.get('ply_nodes', []), totals.get('ply_moves', []))]
+    return summary
+
+def runSelfPlay(board_class, games, depth, random_plies, seed, table_size, quiescence=False, collect_stats=False, processes=0):
+    """Function to play several AI-vs-AI games and total their throughput, searching on processes worker processes if not 0"""
+    rng = random.Random(seed)
+    totals = {} if collect_stats else None
+    parallel = ParallelSearch(processes, table_size, quiescence=quiescence, collect_stats=collect_stats) if processes else None
+    workers = {}
+    start = time.perf_counter()
+    try:
+        results = [playGame(board_class, depth, random_plies, rng, table_size, quiescence, totals, parallel, workers) for game in range(games)]
+    finally:
+        if parallel is not None:
+            parallel.shutdown()
+    seconds = time.perf_counter() - start
+    nodes = sum(result['nodes'] for result in results)
+    search_seconds = sum(result['search_seconds'] for result in results)
+    plies = sum(result['plies'] for result in results)
+    report = {
+        'benchmark': 'selfplay',
+        'games': games,
+        'depth': depth,
+        'quiescence': quiescence,
+        'processes': processes,
+        'seconds': seconds,
+        'nodes': nodes,
+        'nodes_per_second': nodes / search_seconds if search_seconds else 0.0,
+        'positions': plies,
+        'positions_per_second': plies / seconds if seconds else 0.0,
+        'results': {outcome: sum(result['winner'] == outcome for result in results) for outcome in ('red', 'white', 'draw')},
+        'per_game': results,
+    }
+    if totals is not None:
+        report['stats'] = summarizeStats(totals)
+    if parallel is not None:
+        table_stats = [worker['table'] for worker in workers.values() if worker['table'] is not None]
+    else:
+        table_stats = [result['table'] for result in results if 'table' in result]
+    if table_stats:
+        report['table'] = addTableStats(table_stats)
+    if parallel is not None:
+        for worker in workers.values():
+            worker['nodes_per_second'] = worker['nodes'] / worker['seconds'] if worker['seconds'] else 0.0
+        report['workers'] = list(workers.values())
+    return report
+
+def main():
+    parser = argparse.ArgumentParser(description='Checkers engine benchmarks')
+    parser.add_argument('--board', choices=sorted(BOARDS), default='bitboard', help='board backend to benchmark')
+    parser.add_argument('--profile', metavar='PATH', help='write a folded stacks file for a flame graph of the run')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    perft_parser = subparsers.add_parser('perft', help='count leaf positions from the starting board')
+    perft_parser.add_argument('--depth', type=int, default=6)
+    selfplay_parser = subparsers.add_parser('selfplay', help='time AI-vs-AI games')
+    selfplay_parser.add_argument('--games', type=int, default=4)
+    selfplay_parser.add_argument('--depth', type=int, default=4)
+    selfplay_parser.add_argument('--random-plies', type=int, default=4, help='random opening moves so games differ')
+    selfplay_parser.add_argument('--seed', type=int, default=0)
+    selfplay_parser.add_argument('--table-size', type=int, default=1 << 16, help='transposition table entries per side, 0 to disable')
+    selfplay_parser.add_argument('--quiescence', action='store_true', help='follow captures past the depth limit')
+    selfplay_parser.add_argument('--stats', action='store_true', help='report search counters and timings, which slows the search a little')
+    selfplay_parser.add_argument('--processes', type=int, default=0, help='search on this many worker processes with ParallelSearch, 0 searches in this process')
+    args = parser.parse_args()
+    profiler = SamplingProfiler(args.profile) if args.profile else None
+    if profiler:
+        profiler.start()
+    if args.command == 'perft':
+        report = runPerft(BOARDS[args.board], args.depth)
+    else:
+        report = runSelfPlay(BOARDS[args.board], args.games, args.depth, args.random_plies, args.seed, args.table_size, args.quiescence, args.stats, args.processes)
+    if profiler:
+        profiler.stop()
+    report['board'] = args.board
+    report['python'] = platform.python_version()
+    print(json.dumps(report, indent=2))
+
+if __name__ == '__main__':
+    main()
@@ -36,13 +36,30 @@ capturing optional. In almost all variants, the player
 without pieces remaining, or who cannot move due to being 
 blocked, loses the game.
 """
+import os
+import sys
+import time
 import pygame
+if not __package__:
+    # The pycheckers engine is shared with CheckersGame, so this file only runs as part of the Checkers directory
+    sys.exit('Run it from the Checkers directory with python -m CheckersAI.checkers')
 from pycheckers.constants import WIDTH, HEIGHT, SQUARE_SIZE, WHITE
 from pycheckers.game import Game
-from minimax.algorithm import minimax
+from pycheckers.bitboard import BitBoard
+from pycheckers.evaluation import Evaluator
+from .minimax.worker import SearchWorker
+from .minimax.transposition import TranspositionTable
+from .minimax.tablebase import Tablebase
+from .minimax.book import OpeningBook
+from .minimax.algorithm import apply_move
 
 # Setting up pygame display
 FRAMES_PER_SECOND = 60
+AI_TIME_BUDGET_MS = 500 # How long the AI may think about a move
+TRANSPOSITION_TABLE_SIZE = 1 << 18 # Number of positions the AI remembers between searches
+TABLEBASE_FILE = 'endgame.cktb' # Generated with python -m CheckersAI.minimax.tablebase, used if present
+OPENING_BOOK_FILE = 'opening.ckob' # Generated with python -m CheckersAI.minimax.book, used if present
+GAME_RECORD_FILE = 'games.pdn' # Every game played is added to this file, for python -m CheckersAI.minimax.analyze
 WINDOW = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption('Checkers by @wiknwo')
 
@@ -58,13 +75,20 @@ def getRowColumnFromMouse(position):
 def main():
     run = True
     clock = pygame.time.Clock()
-    game = Game(WINDOW)
+    game = Game(WINDOW, BitBoard)
+    game.record.tags.update(Event='Checkers', Date=time.strftime('%Y.%m.%d'), Black='Human', White='AI') # Red is Black in PDN
+    tablebase = Tablebase(TABLEBASE_FILE) if os.path.exists(TABLEBASE_FILE) else None
+    book = OpeningBook(OPENING_BOOK_FILE) if os.path.exists(OPENING_BOOK_FILE) else None
+    worker = SearchWorker(AI_TIME_BUDGET_MS, TranspositionTable(TRANSPOSITION_TABLE_SIZE), tablebase, Evaluator(), quiescence=True)
 
     while run:
         clock.tick(FRAMES_PER_SECOND)
-        if game.turn == WHITE:
-            value, new_board = minimax(game.get_board(), 3, WHITE, game)
-            game.ai_move(new_board)
+        if game.turn == WHITE and not game.ai_thinking():
+            book_move = book.probe(game.get_board(), True) if book else None
+            if book_move:
+                game.ai_move(apply_move(game.get_board(), *book_move, game))
+            else:
+                game.request_ai_move(worker.search(game.get_board(), WHITE, game)) # Played by game.update() once found
         if game.winner() != None:
             print(game.winner())
             run = False
@@ -72,11 +96,18 @@ def main():
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 run = False
-            if event.type == pygame.MOUSEBUTTONDOWN:
+            if event.type == pygame.MOUSEBUTTONDOWN and game.turn != WHITE:
                 mouse_position = pygame.mouse.get_pos()
                 row, column = getRowColumnFromMouse(mouse_position)
                 game.select(row, column)
         game.update()
+    game.cancel_ai_move()
+    worker.shutdown()
+    if game.record.moves:
+        if game.winner() != None:
+            game.record.finish(game.winner())
+        with open(GAME_RECORD_FILE, 'a') as file:
+            file.write(str(game.record) + '\n')
     pygame.quit()
 
 if __name__ == '__main__':
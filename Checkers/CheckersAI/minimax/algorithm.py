@@ -1,37 +1,364 @@
-from copy import deepcopy
-import pygame
+import math
+import time
 from pycheckers import constants
+from pycheckers.zobrist import WHITE_TO_MOVE
+from .transposition import EXACT, LOWER, UPPER
+from .stats import SearchStats
 
-def minimax(current_board, depth, max_player, game):
+MAX_DEPTH = 64 # Deepest iteration iterative deepening will start
+CHECK_INTERVAL = 512 # Nodes searched between checks of the clock
+
+class SearchAborted(Exception):
+    """Raised inside a search when its time budget runs out or it is asked to stop"""
+
+class Search:
     """
-    Implementation of minimax algorithm
+    Alpha-beta search over one board, made and unmade in place.
+
+    Returns the same value and best move as a plain minimax search to
+    the same depth: ties between equally good moves are resolved in
+    favour of the move generated last, exactly as plain minimax does.
+    With quiescence on, positions at the depth limit are searched on
+    along captures until they are quiet, so the values differ.
+    """
+    def __init__(self, game=None, table=None, deadline=None, stop=None, tablebase=None, evaluator=None, quiescence=False, stats=None):
+        """
+        Method to initialize search variables
+
+        Params:
+            game: The game object being passed to the algorithm
+            table: Optional TranspositionTable to reuse results for positions reached by different move orders
+            deadline: Optional time.perf_counter() value after which the search raises SearchAborted
+            stop: Optional threading.Event that makes the search raise SearchAborted once set
+            tablebase: Optional Tablebase whose exact results replace searching the positions it covers
+            evaluator: Optional Evaluator used to score leaves instead of Board.evaluate
+            quiescence: Boolean indicating whether to follow captures past the depth limit
+            stats: Optional SearchStats to count nodes, cutoffs and table hits and time move generation and evaluation
+        """
+        self.game = game
+        self.table = table
+        self.deadline = deadline
+        self.stop = stop
+        self.tablebase = tablebase
+        self.evaluator = evaluator
+        self.quiescence = quiescence
+        self.stats = stats
+        self.nodes = 0
+        self.ply = 0 # Moves made from the position being searched, only kept up to date while collecting stats
+
+    def checkLimits(self):
+        """Method to raise SearchAborted if the deadline has passed or the search was stopped"""
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            raise SearchAborted()
+        if self.stop is not None and self.stop.is_set():
+            raise SearchAborted()
+
+    def evaluate(self, current_board):
+        """Method to score a leaf with the evaluator, or Board.evaluate if there is none"""
+        stats = self.stats
+        if stats is None:
+            return self.evaluator.evaluate(current_board) if self.evaluator is not None else current_board.evaluate()
+        start = time.perf_counter()
+        value = self.evaluator.evaluate(current_board) if self.evaluator is not None else current_board.evaluate()
+        stats.evaluation_seconds += time.perf_counter() - start
+        stats.leaves += 1
+        return value
+
+    def generate(self, current_board, color, hint):
+        """Method to return the ordered moves for a side, timing move generation when collecting stats"""
+        stats = self.stats
+        if stats is None:
+            return order_moves(get_all_move_tuples(current_board, color), hint)
+        start = time.perf_counter()
+        moves = order_moves(get_all_move_tuples(current_board, color), hint)
+        stats.generation_seconds += time.perf_counter() - start
+        stats.expanded(self.ply, len(moves))
+        return moves
+
+    def root(self, current_board, depth, max_player, hint=None):
+        """Method to return (value, (piece, move, skip), index) for the best move, searching hint first"""
+        color = constants.WHITE if max_player else constants.RED
+        key = position_key(current_board, max_player)
+        if hint is None:
+            hint = table_hint(self.table, key)
+        stats = self.stats
+        if stats is not None:
+            stats.depth = depth
+            stats.nodes += 1
+        best_value = float('-inf') if max_player else float('inf')
+        best_move = None
+        best_index = -1
+        moves = self.generate(current_board, color, hint)
+        if stats is not None:
+            self.ply += 1
+        try:
+            for index, piece, move, skip in moves:
+                undo = current_board.make_move(piece, move[0], move[1], skip)
+                try:
+                    if max_player:
+                        # A later generated move only needs to equal the best value to replace it
+                        alpha = best_value if index < best_index else math.nextafter(best_value, float('-inf'))
+                        evaluation = self.alphabeta(current_board, depth - 1, alpha, float('inf'), False)
+                        improved = best_move is None or evaluation > alpha
+                    else:
+                        beta = best_value if index < best_index else math.nextafter(best_value, float('inf'))
+                        evaluation = self.alphabeta(current_board, depth - 1, float('-inf'), beta, True)
+                        improved = best_move is None or evaluation < beta
+                finally:
+                    current_board.undo_move(undo)
+                if improved:
+                    best_value, best_move, best_index = evaluation, (piece, move, skip), index
+        finally:
+            if stats is not None:
+                self.ply -= 1
+        if best_move is not None and self.table is not None:
+            self.table.store(key, depth, best_value, EXACT, best_index)
+        return best_value, best_move, best_index
+
+    def alphabeta(self, current_board, depth, alpha, beta, max_player):
+        """
+        Method to return the minimax value of a position, skipping branches that cannot change the result.
+        Moves are made and taken back on current_board itself, so no boards are copied during the search.
+
+        Params:
+            current_board: The board to evaluate
+            depth: How far should we extend the decision tree
+            alpha: Value the max player is already assured of
+            beta: Value the min player is already assured of
+            max_player: Boolean indicating whether we are the max or min player
+        """
+        self.nodes += 1
+        if self.nodes % CHECK_INTERVAL == 0:
+            self.checkLimits()
+        stats = self.stats
+        if stats is not None:
+            stats.nodes += 1
+            stats.max_ply = max(stats.max_ply, self.ply)
+        if self.tablebase is not None:
+            score = self.tablebase.score(current_board, max_player)
+            if score is not None:
+                if stats is not None:
+                    stats.tablebase_hits += 1
+                return score
+        if depth == 0 or current_board.declareWinner() != None:
+            if self.quiescence and depth == 0 and current_board.declareWinner() == None:
+                return self.quiesce(current_board, alpha, beta, max_player)
+            if stats is None:
+                return self.evaluator.evaluate(current_board) if self.evaluator is not None else current_board.evaluate()
+            return self.evaluate(current_board)
+        table = self.table
+        hint = None
+        if table is not None:
+            key = position_key(current_board, max_player)
+            entry = table.lookup(key)
+            if stats is not None:
+                stats.table_probes += 1
+            if entry is not None:
+                entry_depth, value, flag, hint = entry
+                # Only reuse results searched to exactly this depth so values match an uncached search
+                if entry_depth == depth and (flag == EXACT or (flag == LOWER and value >= beta) or (flag == UPPER and value <= alpha)):
+                    if stats is not None:
+                        stats.table_hits += 1
+                    return value
+        alpha_original, beta_original = alpha, beta
+        best_index = None
+        color = constants.WHITE if max_player else constants.RED
+        if stats is None:
+            moves = order_moves(get_all_move_tuples(current_board, color), hint)
+        else:
+            moves = self.generate(current_board, color, hint)
+            self.ply += 1
+        try:
+            if max_player:
+                maxEval = float('-inf')
+                for index, piece, move, skip in moves:
+                    undo = current_board.make_move(piece, move[0], move[1], skip)
+                    try:
+                        evaluation = self.alphabeta(current_board, depth - 1, alpha, beta, False)
+                    finally:
+                        current_board.undo_move(undo)
+                    if best_index is None or evaluation > maxEval:
+                        maxEval, best_index = evaluation, index
+                    alpha = max(alpha, maxEval)
+                    if alpha >= beta:
+                        if stats is not None:
+                            stats.cutoffs += 1
+                        break # Min player will never allow this position
+                value = maxEval
+            else:
+                minEval = float('inf')
+                for index, piece, move, skip in moves:
+                    undo = current_board.make_move(piece, move[0], move[1], skip)
+                    try:
+                        evaluation = self.alphabeta(current_board, depth - 1, alpha, beta, True)
+                    finally:
+                        current_board.undo_move(undo)
+                    if best_index is None or evaluation < minEval:
+                        minEval, best_index = evaluation, index
+                    beta = min(beta, minEval)
+                    if alpha >= beta:
+                        if stats is not None:
+                            stats.cutoffs += 1
+                        break # Max player will never allow this position
+                value = minEval
+        finally:
+            if stats is not None:
+                self.ply -= 1
+        if table is not None:
+            if value <= alpha_original:
+                flag = UPPER
+            elif value >= beta_original:
+                flag = LOWER
+            else:
+                flag = EXACT
+            table.store(key, depth, value, flag, best_index)
+        return value
+
+    def quiesce(self, current_board, alpha, beta, max_player):
+        """
+        Method to return the value of a position at the depth limit, following only captures until none are left.
+        Capturing is optional in this game, so the side to move can also stop and take the static evaluation.
+        """
+        stats = self.stats
+        if stats is not None:
+            stats.quiescence_nodes += 1
+        value = self.evaluate(current_board)
+        if (value >= beta) if max_player else (value <= alpha):
+            return value
+        captures = current_board.get_capture_tuples(constants.WHITE if max_player else constants.RED)
+        captures.sort(key=lambda capture: -len(capture[2])) # Longest jumps first
+        if stats is not None:
+            if captures:
+                stats.expanded(self.ply, len(captures))
+            self.ply += 1
+        try:
+            for piece, move, skip in captures:
+                if max_player:
+                    alpha = max(alpha, value)
+                else:
+                    beta = min(beta, value)
+                undo = current_board.make_move(piece, move[0], move[1], skip)
+                try:
+                    evaluation = self.alphabeta(current_board, 0, alpha, beta, not max_player)
+                finally:
+                    current_board.undo_move(undo)
+                value = max(value, evaluation) if max_player else min(value, evaluation)
+                if (value >= beta) if max_player else (value <= alpha):
+                    if stats is not None:
+                        stats.cutoffs += 1
+                    break
+        finally:
+            if stats is not None:
+                self.ply -= 1
+        return value
+
+def minimax(current_board, depth, max_player, game, table=None, tablebase=None, evaluator=None, quiescence=False, on_stats=None):
+    """
+    Implementation of minimax algorithm with alpha-beta pruning
 
     Params:
         current_board: The current board for the game
         depth: How far should we extend the decision tree
         max_player: Boolean indicating whether we are the max or min player
         game: The game object being passed to the algorithm
+        table: Optional TranspositionTable shared between searches
+        tablebase: Optional endgame Tablebase
+        evaluator: Optional Evaluator used instead of Board.evaluate
+        quiescence: Boolean indicating whether to follow captures past the depth limit
+        on_stats: Optional function called with a dict of SearchStats once the search finishes
     """
     if depth == 0 or current_board.declareWinner() != None:
-        return current_board.evaluate(), current_board
-    elif max_player:
-        maxEval = float('-inf')
-        best_move = None
-        for move in get_all_moves(current_board, constants.WHITE, game):
-            evaluation = minimax(move, depth - 1, False, game)[0]
-            maxEval = max(maxEval, evaluation)
-            if maxEval == evaluation:
-                best_move = move
-        return maxEval, best_move
-    else:
-        minEval = float('inf')
-        best_move = None
-        for move in get_all_moves(current_board, constants.RED, game):
-            evaluation = minimax(move, depth - 1, True, game)[0]
-            minEval = min(minEval, evaluation)
-            if minEval == evaluation:
-                best_move = move
-        return minEval, best_move
+        return evaluator.evaluate(current_board) if evaluator is not None else current_board.evaluate(), current_board
+    stats = SearchStats() if on_stats is not None else None
+    value, best_move, best_index = Search(game, table, tablebase=tablebase, evaluator=evaluator, quiescence=quiescence, stats=stats).root(current_board, depth, max_player)
+    report(stats, on_stats)
+    if best_move is None:
+        return value, None
+    return value, apply_move(current_board, *best_move, game)
+
+def iterative_deepening(current_board, budget_ms, max_player, game, table=None, max_depth=MAX_DEPTH, stop=None, tablebase=None, evaluator=None, quiescence=False, on_stats=None):
+    """
+    Function to search one ply deeper at a time until the time budget runs out
+
+    Each iteration tries the previous iteration's best move first. Returns
+    (value, new_board, depth) for the deepest iteration that finished; the
+    first iteration ignores the budget so there is always a move to play,
+    but setting stop aborts every iteration and raises SearchAborted.
+
+    Params:
+        current_board: The current board for the game, left untouched
+        budget_ms: Wall-clock time the search may take in milliseconds
+        max_player: Boolean indicating whether we are the max or min player
+        game: The game object being passed to the algorithm
+        table: Optional TranspositionTable shared between searches
+        max_depth: Deepest iteration to start
+        stop: Optional threading.Event used to cancel the search from another thread
+        tablebase: Optional endgame Tablebase
+        evaluator: Optional Evaluator used instead of Board.evaluate
+        quiescence: Boolean indicating whether to follow captures past the depth limit
+        on_stats: Optional function called with a dict of SearchStats after every iteration, including one cut short
+    """
+    deadline = time.perf_counter() + budget_ms / 1000
+    if current_board.declareWinner() != None:
+        return evaluator.evaluate(current_board) if evaluator is not None else current_board.evaluate(), current_board, 0
+    board = current_board.copy() # Searched in place, so the caller's board never changes while we think
+    search = Search(game, table, stop=stop, tablebase=tablebase, evaluator=evaluator, quiescence=quiescence)
+    search.stats = SearchStats() if on_stats is not None else None
+    value, best_move, best_index = search.root(board, 1, max_player)
+    report(search.stats, on_stats)
+    completed_depth = 1
+    search = Search(game, table, deadline, stop, tablebase, evaluator, quiescence)
+    for depth in range(2, max_depth + 1):
+        if best_move is None or math.isinf(value) or time.perf_counter() > deadline:
+            break # No moves, a forced result, or no time left
+        search.stats = SearchStats() if on_stats is not None else None
+        try:
+            value, best_move, best_index = search.root(board, depth, max_player, best_index)
+        except SearchAborted:
+            if search.stats is not None:
+                search.stats.aborted = True
+            report(search.stats, on_stats)
+            if stop is not None and stop.is_set():
+                raise
+            break # Out of time: keep the result of the last iteration that finished
+        report(search.stats, on_stats)
+        completed_depth = depth
+    if best_move is None:
+        return value, None, completed_depth
+    return value, apply_move(board, *best_move, game), completed_depth
+
+def report(stats, on_stats):
+    """Function to finish stats and hand them to the on_stats callback, if stats are being collected"""
+    if stats is not None:
+        stats.finish()
+        on_stats(stats.toDict())
+
+def position_key(current_board, max_player):
+    """Function to return the Zobrist key of a position including the side to move"""
+    return current_board.hash ^ WHITE_TO_MOVE if max_player else current_board.hash
+
+def table_hint(table, key):
+    """Function to return the best move index a transposition table remembers for a position, if any"""
+    if table is None:
+        return None
+    entry = table.lookup(key)
+    return entry[3] if entry is not None else None
+
+def order_moves(move_tuples, hint=None):
+    """
+    Function to sort moves so the hinted move comes first, then captures (longest jumps first),
+    then king moves, keeping generation order otherwise
+    """
+    ordered = [(index, piece, move, skip) for index, (piece, move, skip) in enumerate(move_tuples)]
+    ordered.sort(key=lambda entry: (entry[0] != hint, -len(entry[3]), not entry[1].isKing))
+    return ordered
+
+def apply_move(current_board, piece, move, skip, game):
+    """Function to return a copy of the board with the move made on it"""
+    tmp_board = current_board.copy()
+    tmp_piece = tmp_board.getPiece(piece.row, piece.column)
+    tmp_skip = [tmp_board.getPiece(skipped.row, skipped.column) for skipped in skip]
+    return simulate_move(tmp_piece, move, tmp_board, game, tmp_skip)
 
 def simulate_move(piece, move, board, game, skip):
     """Function to simulate move on board and return new board after simulating move"""
@@ -40,15 +367,13 @@ def simulate_move(piece, move, board, game, skip):
         board.remove(skip)
     return board
 
+def get_all_move_tuples(current_board, color):
+    """Function that returns (piece, move, skip) for every move that can be made in a turn"""
+    return current_board.get_move_tuples(color)
+
 def get_all_moves(current_board, color, game):
     """Function that returns all possible moves that can be made in a turn"""
     moves = [] # [[board, piece]] make this move then board will look like this
-    for piece in current_board.get_all_pieces(color):
-        valid_moves = current_board.getValidMoves(piece)
-        for move, skip in valid_moves.items():
-            # move = (row, column), skip = [pieces to skip]
-            tmp_board = deepcopy(current_board)
-            tmp_piece = tmp_board.getPiece(piece.row, piece.column)
-            new_board = simulate_move(tmp_piece, move, tmp_board, game, skip)
-            moves.append(new_board)
-    return moves
\ No newline at end of file
+    for piece, move, skip in get_all_move_tuples(current_board, color):
+        moves.append(apply_move(current_board, piece, move, skip, game))
+    return moves
@@ -0,0 +1,129 @@
+"""
+Batch analysis of recorded games, for tuning the evaluation offline.
+
+    python -m CheckersAI.minimax.analyze games.pdn --depth 6 --workers 4 --output analysis.jsonl
+
+Games are read from the PDN file one at a time and shared out over a
+pool of worker processes, so files with thousands of games never need
+to fit in memory. Every move is annotated with the search score of the
+move played, the engine's best move and its score, how much the move
+lost against the best one and the evaluation features of the position
+before it. Scores are from white's point of view. Each game is written
+as one JSON line, in the same order as the file:
+
+    {"game": 0, "tags": {...}, "result": "0-1", "moves": [{"ply": 1, "color": "red", "move": "11-15",
+     "score": -0.1, "best": "11-16", "best_score": 0.0, "loss": 0.1, "features": [...]}, ...]}
+
+A game with an illegal or unreadable move gets an "error" and the
+moves analysed before it.
+"""
+import argparse
+import collections
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pycheckers.constants import WHITE
+from pycheckers.bitboard import BitBoard
+from pycheckers.evaluation import Evaluator
+from pycheckers.pdn import GameRecord, splitGames, squareNumber, formatMove
+from .algorithm import Search
+from .transposition import TranspositionTable
+from .tablebase import Tablebase
+
+# Set in each worker process by _initWorker
+_depth = None
+_table = None
+_tablebase = None
+_evaluator = None
+_quiescence = False
+
+def _initWorker(depth, table_size, tablebase_path, quiescence):
+    """Function run once in each worker process to set up its search"""
+    global _depth, _table, _tablebase, _evaluator, _quiescence
+    _depth = depth
+    _table = TranspositionTable(table_size) if table_size else None
+    _tablebase = Tablebase(tablebase_path) if tablebase_path else None
+    _evaluator = Evaluator()
+    _quiescence = quiescence
+
+def _analyzeGame(job):
+    """Function run in a worker process to annotate every move of one game"""
+    number, text = job
+    annotation = {'game': number, 'moves': []}
+    try:
+        record = GameRecord.parse(text)
+        annotation['tags'] = record.tags
+        annotation['result'] = record.result
+        for board, color, piece, move, skip in record.replay(BitBoard):
+            annotation['moves'].append(analyzeMove(board, color == WHITE, piece, move, skip, len(annotation['moves']) + 1))
+    except ValueError as error:
+        annotation['error'] = str(error)
+    return annotation
+
+def analyzeMove(board, max_player, piece, move, skip, ply):
+    """Function to search a position and the move played in it, returning the move's annotation"""
+    search = Search(None, _table, tablebase=_tablebase, evaluator=_evaluator, quiescence=_quiescence)
+    features = _evaluator.featuresOf(board)
+    best_score, best_move, best_index = search.root(board, _depth, max_player)
+    played = ((piece.row, piece.column), move)
+    if best_move is not None and ((best_move[0].row, best_move[0].column), best_move[1]) == played:
+        score = best_score
+    else:
+        undo = board.make_move(piece, move[0], move[1], skip)
+        try:
+            score = search.alphabeta(board, _depth - 1, float('-inf'), float('inf'), not max_player)
+        finally:
+            board.undo_move(undo)
+    best = None
+    if best_move is not None:
+        best = formatMove(squareNumber(best_move[0].row, best_move[0].column), squareNumber(*best_move[1]), bool(best_move[2]))
+    return {
+        'ply': ply,
+        'color': 'white' if max_player else 'red',
+        'move': formatMove(squareNumber(piece.row, piece.column), squareNumber(*move), bool(skip)),
+        'score': score,
+        'best': best,
+        'best_score': best_score,
+        'loss': (best_score - score) if max_player else (score - best_score),
+        'features': list(features),
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description='Annotate recorded checkers games with search scores')
+    parser.add_argument('pdn', help='PDN file of games, - for stdin')
+    parser.add_argument('--depth', type=int, default=6, help='search depth for every position')
+    parser.add_argument('--workers', type=int, default=None, help='analysis processes, one per CPU core by default')
+    parser.add_argument('--table-size', type=int, default=1 << 18, help='transposition table entries per worker, 0 to disable')
+    parser.add_argument('--tablebase', default=None, help='endgame tablebase file from python -m CheckersAI.minimax.tablebase')
+    parser.add_argument('--quiescence', action='store_true', help='follow captures past the depth limit')
+    parser.add_argument('--output', default='-', help='JSON lines file to write, - for stdout')
+    args = parser.parse_args()
+    if args.depth < 1:
+        sys.exit('--depth must be at least 1')
+    source = sys.stdin if args.pdn == '-' else open(args.pdn)
+    output = sys.stdout if args.output == '-' else open(args.output, 'w')
+    workers = args.workers or os.cpu_count()
+    start = time.perf_counter()
+    games = moves = 0
+    def write(annotation):
+        nonlocal games, moves
+        output.write(json.dumps(annotation) + '\n')
+        games += 1
+        moves += len(annotation['moves'])
+    with ProcessPoolExecutor(workers, initializer=_initWorker, initargs=(args.depth, args.table_size, args.tablebase, args.quiescence)) as executor:
+        # Only a few games per worker are read ahead, and results are written in file order
+        pending = collections.deque()
+        for job in enumerate(splitGames(source)):
+            pending.append(executor.submit(_analyzeGame, job))
+            if len(pending) >= 4 * workers:
+                write(pending.popleft().result())
+        while pending:
+            write(pending.popleft().result())
+    if output is not sys.stdout:
+        output.close()
+    print(f'Analysed {games} games, {moves} moves in {time.perf_counter() - start:.1f}s', file=sys.stderr)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+"""
+Opening book: the move a deep search picks in every position of the
+first few plies, so the AI can play the opening by lookup instead of
+searching the same positions every game.
+
+Build it once from the Checkers directory with
+
+    python -m CheckersAI.minimax.book --plies 4 --depth 8 --output opening.ckob
+
+Every move of both sides is followed for --plies plies from the
+starting board and each position is searched to --depth, with the
+same evaluation and quiescence search the game uses unless --weights
+or --no-quiescence say otherwise. The file
+holds a small header, the sorted Zobrist keys (side to move included)
+and a 32-bit move for each: from row, from column, to row, to column.
+"""
+import argparse
+import json
+import struct
+import sys
+import time
+from array import array
+from pycheckers.constants import RED, WHITE
+from pycheckers.bitboard import BitBoard
+from pycheckers.evaluation import Evaluator
+from .algorithm import Search, get_all_move_tuples, position_key
+from .transposition import TranspositionTable
+
+MAGIC = b'CKOB'
+HEADER = struct.Struct('<4sBxxxQ') # magic, version, number of positions
+VERSION = 1
+
+def encodeMove(piece, move):
+    """Function to pack a move's start and end squares into 32 bits"""
+    return piece.row << 24 | piece.column << 16 | move[0] << 8 | move[1]
+
+def decodeMove(value):
+    """Function to unpack a move into ((from row, from column), (to row, to column))"""
+    return (value >> 24 & 0xFF, value >> 16 & 0xFF), (value >> 8 & 0xFF, value & 0xFF)
+
+class OpeningBook:
+    """Class to look up book moves, loaded into a dict keyed by Zobrist hash"""
+    def __init__(self, path):
+        """Method to read a book file"""
+        with open(path, 'rb') as file:
+            data = file.read()
+        magic, version, count = HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a version {VERSION} checkers opening book')
+        keys = array('Q')
+        keys.frombytes(data[HEADER.size:HEADER.size + 8 * count])
+        moves = array('I')
+        moves.frombytes(data[HEADER.size + 8 * count:HEADER.size + 12 * count])
+        self.moves = dict(zip(keys, moves))
+        self.hits = self.misses = 0
+
+    def probe(self, board, max_player):
+        """Method to return the book move as (piece, move, skip) for the board, or None if the position isn't in the book"""
+        value = self.moves.get(position_key(board, max_player))
+        if value is not None:
+            start, destination = decodeMove(value)
+            # Check the move against the position in case two positions share a hash
+            for piece, move, skip in get_all_move_tuples(board, WHITE if max_player else RED):
+                if (piece.row, piece.column) == start and move == destination:
+                    self.hits += 1
+                    return piece, move, skip
+        self.misses += 1
+        return None
+
+def build(plies, depth, evaluator=None, quiescence=True, log=print):
+    """
+    Function to search every position in the first plies plies and return {key: move}.
+    Positions are scored with evaluator, Evaluator() by default, as checkers.py does.
+    """
+    evaluator = evaluator or Evaluator()
+    board = BitBoard()
+    table = TranspositionTable(1 << 20)
+    book = {}
+    def visit(max_player, ply):
+        key = position_key(board, max_player)
+        if ply >= plies or key in book or board.declareWinner() != None:
+            return
+        value, best_move, best_index = Search(None, table, evaluator=evaluator, quiescence=quiescence).root(board, depth, max_player)
+        if best_move is None:
+            return
+        book[key] = encodeMove(best_move[0], best_move[1])
+        if len(book) % 50 == 0:
+            log(f'{len(book)} positions')
+        for piece, move, skip in get_all_move_tuples(board, WHITE if max_player else RED):
+            undo = board.make_move(piece, move[0], move[1], skip)
+            visit(not max_player, ply + 1)
+            board.undo_move(undo)
+    visit(False, 0) # Red moves first
+    return book
+
+def write(book, path):
+    """Function to write a book built by build() to a file"""
+    keys = sorted(book)
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, len(keys)))
+        file.write(array('Q', keys).tobytes())
+        file.write(array('I', (book[key] for key in keys)).tobytes())
+
+def main():
+    parser = argparse.ArgumentParser(description='Build a checkers opening book')
+    parser.add_argument('--plies', type=int, default=4, help='how many plies from the start the book covers')
+    parser.add_argument('--depth', type=int, default=8, help='search depth used for each book position')
+    parser.add_argument('--weights', type=json.loads, default=None, help='evaluation weights as JSON, e.g. \'{"mobility": 0.1}\', the rest keep the weights the game uses')
+    parser.add_argument('--no-quiescence', action='store_true', help='stop every search at its depth limit, even in the middle of captures')
+    parser.add_argument('--output', default='opening.ckob')
+    args = parser.parse_args()
+    if args.plies < 1 or args.depth < 1:
+        sys.exit('--plies and --depth must be at least 1')
+    try:
+        evaluator = Evaluator(args.weights)
+    except (TypeError, ValueError) as error:
+        sys.exit(f'--weights: {error}')
+    start = time.perf_counter()
+    book = build(args.plies, args.depth, evaluator, not args.no_quiescence)
+    write(book, args.output)
+    print(f'Wrote {len(book)} positions to {args.output} in {time.perf_counter() - start:.1f}s')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,144 @@
+import math
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pycheckers import constants
+from .algorithm import Search, apply_move, get_all_move_tuples, order_moves
+from .transposition import TranspositionTable
+from .stats import SearchStats
+from .tablebase import Tablebase
+
+# Set in each worker process by _initWorker
+_shared_bound = None
+_table = None
+_tablebase = None
+_evaluator = None
+_quiescence = False
+_collect_stats = False
+
+def _initWorker(shared_bound, table_size, tablebase_path, evaluator, quiescence, collect_stats):
+    """Function run once in each worker process to keep the shared bound and create its own transposition table"""
+    global _shared_bound, _table, _tablebase, _evaluator, _quiescence, _collect_stats
+    _shared_bound = shared_bound
+    _table = TranspositionTable(table_size) if table_size else None
+    _tablebase = Tablebase(tablebase_path) if tablebase_path else None # Memory-mapped, so every worker shares the same pages
+    _evaluator = evaluator
+    _quiescence = quiescence
+    _collect_stats = collect_stats
+
+def _searchRootMove(board_class, snapshot, depth, max_player, index):
+    """
+    Function run in a worker process to search one root move.
+
+    The move is searched with a window just outside the best value any
+    worker has found so far, so results that could still be the best
+    (including ties) are exact and the others are cut off early.
+    Returns (index, value, exact, nodes, seconds, pid, SearchStats or None, the worker's table stats or None).
+    """
+    start = time.perf_counter()
+    board = board_class.fromSnapshot(snapshot)
+    color = constants.WHITE if max_player else constants.RED
+    piece, move, skip = get_all_move_tuples(board, color)[index]
+    board.make_move(piece, move[0], move[1], skip)
+    search = Search(None, _table, tablebase=_tablebase, evaluator=_evaluator, quiescence=_quiescence, stats=SearchStats() if _collect_stats else None)
+    if search.stats is not None:
+        search.stats.depth = depth
+        search.ply = 1 # The root move has been made, so plies line up with a single-process search
+    with _shared_bound.get_lock():
+        bound = _shared_bound.value
+    if max_player:
+        alpha = math.nextafter(bound, float('-inf'))
+        value = search.alphabeta(board, depth - 1, alpha, float('inf'), False)
+        exact = value > alpha or alpha == float('-inf')
+        if exact:
+            with _shared_bound.get_lock():
+                _shared_bound.value = max(_shared_bound.value, value)
+    else:
+        beta = math.nextafter(bound, float('inf'))
+        value = search.alphabeta(board, depth - 1, float('-inf'), beta, True)
+        exact = value < beta or beta == float('inf')
+        if exact:
+            with _shared_bound.get_lock():
+                _shared_bound.value = min(_shared_bound.value, value)
+    return index, value, exact, search.nodes, time.perf_counter() - start, os.getpid(), search.stats, _table.stats() if _table is not None else None
+
+class ParallelSearch:
+    """
+    Class to split the root moves of an alpha-beta search across a pool
+    of worker processes. Each worker keeps its own transposition table
+    between searches and the best root value found so far is shared
+    through shared memory to narrow the other workers' windows. The
+    result is the same value and move the single-process search returns.
+    """
+    def __init__(self, processes=None, table_size=1 << 16, tablebase_path=None, evaluator=None, quiescence=False, collect_stats=False):
+        """
+        Method to start the worker processes, one per CPU core by default, optionally probing an endgame tablebase file.
+        quiescence follows captures past the depth limit as Search does, and collect_stats makes every search return a SearchStats.
+        """
+        self.processes = processes or os.cpu_count()
+        self.evaluator = evaluator
+        self.collect_stats = collect_stats
+        self.bound = multiprocessing.Value('d', 0.0)
+        self.executor = ProcessPoolExecutor(self.processes, initializer=_initWorker,
+                                            initargs=(self.bound, table_size, tablebase_path, evaluator, quiescence, collect_stats))
+
+    def search(self, current_board, depth, max_player, game=None):
+        """
+        Method to search to a fixed depth, returning (value, new_board, stats)
+
+        stats holds the total nodes, wall-clock seconds and nodes per second,
+        plus the root moves, nodes, seconds, nodes per second and transposition table counters of each worker.
+        With collect_stats it also holds 'search', the SearchStats of every worker added together.
+        """
+        start = time.perf_counter()
+        search_stats = SearchStats() if self.collect_stats else None
+        if depth == 0 or current_board.declareWinner() != None:
+            value = self.evaluator.evaluate(current_board) if self.evaluator is not None else current_board.evaluate()
+            stats = {'nodes': 0, 'seconds': 0.0, 'nodes_per_second': 0.0, 'workers': {}}
+            if search_stats is not None:
+                stats['search'] = search_stats
+            return value, current_board, stats
+        color = constants.WHITE if max_player else constants.RED
+        move_tuples = get_all_move_tuples(current_board, color)
+        if search_stats is not None:
+            # The root itself, counted the way Search.root counts it
+            search_stats.depth = depth
+            search_stats.nodes += 1
+            search_stats.expanded(0, len(move_tuples))
+        with self.bound.get_lock():
+            self.bound.value = float('-inf') if max_player else float('inf')
+        snapshot = current_board.snapshot() # A few bytes to send to each worker instead of the whole board
+        futures = [self.executor.submit(_searchRootMove, type(current_board), snapshot, depth, max_player, index)
+                   for index, piece, move, skip in order_moves(move_tuples)]
+        best_value = float('-inf') if max_player else float('inf')
+        best_index = None
+        workers = {}
+        for future in futures:
+            index, value, exact, nodes, seconds, pid, worker_stats, table_stats = future.result()
+            if search_stats is not None:
+                search_stats.merge(worker_stats)
+            worker = workers.setdefault(pid, {'moves': 0, 'nodes': 0, 'seconds': 0.0})
+            worker['moves'] += 1
+            worker['nodes'] += nodes
+            worker['seconds'] += seconds
+            worker['table'] = table_stats # Counted since the worker started, so the latest is the total
+            if not exact:
+                continue
+            # Ties go to the move generated last, as in the single-process search
+            if best_index is None or (value > best_value if max_player else value < best_value) or (value == best_value and index > best_index):
+                best_value, best_index = value, index
+        for worker in workers.values():
+            worker['nodes_per_second'] = worker['nodes'] / worker['seconds'] if worker['seconds'] else 0.0
+        elapsed = time.perf_counter() - start
+        nodes = sum(worker['nodes'] for worker in workers.values())
+        stats = {'nodes': nodes, 'seconds': elapsed, 'nodes_per_second': nodes / elapsed if elapsed else 0.0, 'workers': workers}
+        if search_stats is not None:
+            stats['search'] = search_stats
+        if best_index is None:
+            return best_value, None, stats
+        return best_value, apply_move(current_board, *move_tuples[best_index], game), stats
+
+    def shutdown(self):
+        """Method to stop the worker processes"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
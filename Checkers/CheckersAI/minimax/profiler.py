@@ -0,0 +1,63 @@
+"""
+Sampling profiler for the AI search. While it runs, a background
+thread looks at the call stack of the profiled thread every interval
+and counts how often each stack is seen. The result is written in the
+folded format ("outer;inner;innermost count" per line) read by
+flamegraph.pl, speedscope and most other flame graph tools:
+
+    with SamplingProfiler('search.folded'):
+        minimax(board, 6, True, None)
+"""
+import collections
+import os
+import sys
+import threading
+import time
+
+class SamplingProfiler:
+    """Class to sample one thread's call stack at a fixed interval and write the counts as folded stacks"""
+    def __init__(self, path, interval=0.001, thread=None):
+        """Method to initialize profiler variables, profiling the thread that starts it unless another is given"""
+        self.path = path
+        self.interval = interval
+        self.thread = thread
+        self.samples = collections.Counter()
+        self.running = threading.Event()
+        self.sampler = None
+
+    def start(self):
+        """Method to start sampling"""
+        target = (self.thread or threading.current_thread()).ident
+        self.running.set()
+        self.sampler = threading.Thread(target=self.__sample, args=(target,), name='checkers-profiler', daemon=True)
+        self.sampler.start()
+
+    def stop(self):
+        """Method to stop sampling and write the folded stacks file"""
+        self.running.clear()
+        self.sampler.join()
+        with open(self.path, 'w') as file:
+            for stack, count in self.samples.most_common():
+                file.write(f'{stack} {count}\n')
+
+    def __sample(self, target):
+        """Private method run on the sampling thread"""
+        while self.running.is_set():
+            frame = sys._current_frames().get(target)
+            if frame is not None:
+                names = []
+                while frame is not None:
+                    code = frame.f_code
+                    names.append(f'{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})')
+                    frame = frame.f_back
+                self.samples[';'.join(reversed(names))] += 1
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        """Method to start sampling when used as a context manager"""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Method to stop sampling and write the file when the with block ends"""
+        self.stop()
@@ -0,0 +1,223 @@
+"""
+Headless AI service: one process playing the AI side of many games at
+once. Positions arrive as JSON lines, searches are shared out over a
+pool of worker processes and each reply is written as soon as its
+search finishes, so replies can come back in a different order.
+
+Run it from the Checkers directory, reading stdin and writing stdout
+
+    python -m CheckersAI.minimax.server --workers 4 --budget 500
+
+or listening on a local TCP port, one JSON line per request and reply
+
+    python -m CheckersAI.minimax.server --port 8765
+
+A request gives the game id (a string or a number), the position as a hex Snapshot (see
+pycheckers/snapshot.py), the side to move and optionally how long the
+AI may think, counted from when the request arrives:
+
+    {"game": "42", "board": "<snapshot hex>", "player": "white", "budget_ms": 300}
+
+and the reply gives the move, the squares it captures, the position
+after it and how the search went:
+
+    {"game": "42", "move": [[2, 1], [3, 0]], "captures": [], "board": "<snapshot hex>", "value": 0.0, "depth": 7, "source": "search"}
+
+move is null when the side to move has no moves. Requests that can't
+be read get {"game": ..., "error": "..."}. A new request for a game
+whose previous search hasn't started yet replaces it.
+"""
+import argparse
+import json
+import os
+import socketserver
+import sys
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from pycheckers.bitboard import BitBoard
+from pycheckers.evaluation import Evaluator
+from pycheckers.snapshot import Snapshot, LAYOUT
+from pycheckers.pdn import moveBetween
+from .algorithm import iterative_deepening, apply_move
+from .transposition import TranspositionTable
+from .tablebase import Tablebase
+from .book import OpeningBook
+
+PLAYERS = {'red': False, 'white': True} # JSON player name to max_player
+
+# Set in each worker process by _initWorker
+_table = None
+_tablebase = None
+_evaluator = None
+_quiescence = False
+
+def _initWorker(table_size, tablebase_path, evaluator, quiescence):
+    """Function run once in each worker process to create its own transposition table and open the tablebase"""
+    global _table, _tablebase, _evaluator, _quiescence
+    _table = TranspositionTable(table_size) if table_size else None
+    _tablebase = Tablebase(tablebase_path) if tablebase_path else None
+    _evaluator = evaluator
+    _quiescence = quiescence
+
+def _searchPosition(snapshot, max_player, deadline):
+    """Function run in a worker process to search a position until the deadline (a time.time() value), returning (value, snapshot after the move or None, depth)"""
+    board = BitBoard.fromSnapshot(snapshot)
+    budget_ms = max(deadline - time.time(), 0) * 1000 # Time spent waiting in the queue comes out of the game's budget
+    value, new_board, depth = iterative_deepening(board, budget_ms, max_player, None, _table, tablebase=_tablebase, evaluator=_evaluator, quiescence=_quiescence)
+    return value, None if new_board is None else new_board.snapshot(), depth
+
+def describeMove(before, after, max_player):
+    """Function to work out ((from row, from column), (to row, to column)) and the captured squares from the snapshots before and after a move"""
+    start, destination, captured = moveBetween(before.masks(), after.masks(), max_player)
+    return [list(start), list(destination)], [list(square) for square in captured]
+
+class AIServer:
+    """
+    Class to schedule AI searches for many games over a pool of worker
+    processes. Each worker keeps its own transposition table between
+    searches. Opening book moves are answered at once without a search.
+    """
+    def __init__(self, workers=None, budget_ms=500, table_size=1 << 18, tablebase_path=None, book_path=None, evaluator=None, quiescence=True):
+        """Method to start the worker processes, one per CPU core by default"""
+        self.budget_ms = budget_ms
+        self.book = OpeningBook(book_path) if book_path else None
+        self.executor = ProcessPoolExecutor(workers or os.cpu_count(), initializer=_initWorker,
+                                            initargs=(table_size, tablebase_path, evaluator or Evaluator(), quiescence))
+        self.pending = {} # game: future of the search most recently requested for it
+        self.lock = threading.Lock()
+
+    def submit(self, request):
+        """Method to start answering a request dict, returning a Future for the reply dict"""
+        game = request.get('game') if isinstance(request, dict) else None # Checked by parse before it is used as a key
+        try:
+            snapshot, max_player, budget_ms = self.parse(request)
+        except (KeyError, TypeError, ValueError) as error:
+            return self.reply({'game': game, 'error': str(error)})
+        board = BitBoard.fromSnapshot(snapshot)
+        if board.declareWinner() != None:
+            return self.reply({'game': game, 'move': None, 'captures': [], 'board': snapshot.hex(), 'value': None, 'depth': 0, 'source': 'finished'})
+        book_move = self.book.probe(board, max_player) if self.book else None
+        if book_move:
+            new_board = apply_move(board, *book_move, None)
+            return self.reply(self.moveReply(game, snapshot, new_board.snapshot(), max_player, None, 0, 'book'))
+        search = self.executor.submit(_searchPosition, snapshot, max_player, time.time() + budget_ms / 1000)
+        with self.lock:
+            previous = self.pending.get(game)
+            self.pending[game] = search
+        if previous is not None:
+            # Only succeeds if the old search is still queued. Cancelling runs its finish() at once, which takes the lock
+            previous.cancel()
+        reply = Future()
+        search.add_done_callback(lambda search: self.finish(game, snapshot, max_player, search, reply))
+        return reply
+
+    def parse(self, request):
+        """Method to check a request and return (snapshot, max_player, budget_ms), raising ValueError if it is malformed"""
+        if not isinstance(request, dict):
+            raise ValueError('request must be a JSON object')
+        if not isinstance(request.get('game'), (str, int)) or isinstance(request['game'], bool):
+            raise ValueError('game must be a string or a number')
+        data = bytes.fromhex(request['board'])
+        if len(data) != LAYOUT.size:
+            raise ValueError(f'board must be a {LAYOUT.size}-byte snapshot')
+        if request['player'] not in PLAYERS:
+            raise ValueError('player must be "red" or "white"')
+        budget_ms = float(request.get('budget_ms', self.budget_ms))
+        if budget_ms < 0:
+            raise ValueError('budget_ms must not be negative')
+        return Snapshot(data), PLAYERS[request['player']], budget_ms
+
+    def finish(self, game, snapshot, max_player, search, reply):
+        """Method to turn a finished search into its reply"""
+        with self.lock:
+            if self.pending.get(game) is search:
+                del self.pending[game]
+        if search.cancelled():
+            reply.set_result({'game': game, 'error': 'replaced by a newer request for this game'})
+        elif search.exception() is not None:
+            reply.set_result({'game': game, 'error': repr(search.exception())})
+        else:
+            value, new_snapshot, depth = search.result()
+            if new_snapshot is None:
+                reply.set_result({'game': game, 'move': None, 'captures': [], 'board': snapshot.hex(), 'value': value, 'depth': depth, 'source': 'search'})
+            else:
+                reply.set_result(self.moveReply(game, snapshot, new_snapshot, max_player, value, depth, 'search'))
+
+    def moveReply(self, game, snapshot, new_snapshot, max_player, value, depth, source):
+        """Method to build the reply for a move"""
+        move, captures = describeMove(snapshot, new_snapshot, max_player)
+        return {'game': game, 'move': move, 'captures': captures, 'board': new_snapshot.hex(), 'value': value, 'depth': depth, 'source': source}
+
+    def reply(self, message):
+        """Method to return a Future already holding a reply"""
+        future = Future()
+        future.set_result(message)
+        return future
+
+    def serveLines(self, lines, write):
+        """Method to answer every JSON line from an iterable, calling write(line) for each reply, then wait for the last reply"""
+        lock = threading.Lock()
+        outstanding = []
+        def send(future):
+            with lock:
+                write(json.dumps(future.result()) + '\n')
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                future = self.reply({'game': None, 'error': f'invalid JSON: {error}'})
+            else:
+                future = self.submit(request)
+            future.add_done_callback(send)
+            outstanding.append(future)
+            outstanding = [future for future in outstanding if not future.done()]
+        for future in outstanding:
+            future.result()
+
+    def shutdown(self):
+        """Method to stop the worker processes"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
+
+class _ConnectionHandler(socketserver.StreamRequestHandler):
+    """Class to serve one TCP connection's JSON lines"""
+    def handle(self):
+        """Method to answer requests until the client closes the connection"""
+        def write(line):
+            self.wfile.write(line.encode())
+            self.wfile.flush()
+        lines = (line.decode() for line in self.rfile)
+        self.server.ai_server.serveLines(lines, write)
+
+def main():
+    parser = argparse.ArgumentParser(description='Serve checkers AI moves for many games over JSON lines')
+    parser.add_argument('--workers', type=int, default=None, help='search processes, one per CPU core by default')
+    parser.add_argument('--budget', type=float, default=500, help='default thinking time per move in milliseconds')
+    parser.add_argument('--table-size', type=int, default=1 << 18, help='transposition table entries per worker, 0 to disable')
+    parser.add_argument('--tablebase', default=None, help='endgame tablebase file from python -m CheckersAI.minimax.tablebase')
+    parser.add_argument('--book', default=None, help='opening book file from python -m CheckersAI.minimax.book')
+    parser.add_argument('--no-quiescence', action='store_true', help='stop every search at its depth limit, even in the middle of captures')
+    parser.add_argument('--port', type=int, default=None, help='listen on this localhost TCP port instead of stdin')
+    args = parser.parse_args()
+    server = AIServer(args.workers, args.budget, args.table_size, args.tablebase, args.book, quiescence=not args.no_quiescence)
+    try:
+        if args.port is None:
+            def write(line):
+                sys.stdout.write(line)
+                sys.stdout.flush()
+            server.serveLines(sys.stdin, write)
+        else:
+            with socketserver.ThreadingTCPServer(('127.0.0.1', args.port), _ConnectionHandler) as tcp_server:
+                tcp_server.ai_server = server
+                tcp_server.daemon_threads = True
+                print(f'Serving on 127.0.0.1:{args.port}', file=sys.stderr)
+                tcp_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
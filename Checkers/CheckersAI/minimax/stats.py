@@ -0,0 +1,73 @@
+import time
+
+class SearchStats:
+    """
+    Class to collect counters and timings for one search. Pass one to
+    Search (or an on_stats callback to minimax and iterative_deepening)
+    to see where a slow move spent its time. Ply 0 is the position
+    being searched; plies past the nominal depth are quiescence.
+    """
+    def __init__(self):
+        """Method to initialize every counter to zero"""
+        self.depth = 0
+        self.aborted = False # Set when the search ran out of time or was stopped before finishing
+        self.nodes = 0
+        self.leaves = 0 # Positions scored by the evaluation
+        self.cutoffs = 0 # Move loops left early by an alpha-beta cutoff
+        self.table_probes = 0
+        self.table_hits = 0 # Probes whose stored value was used instead of searching
+        self.tablebase_hits = 0
+        self.quiescence_nodes = 0
+        self.max_ply = 0
+        self.ply_nodes = [] # Positions expanded at each ply
+        self.ply_moves = [] # Moves generated at each ply
+        self.generation_seconds = 0.0
+        self.evaluation_seconds = 0.0
+        self.start = time.perf_counter()
+        self.seconds = 0.0
+
+    def expanded(self, ply, moves):
+        """Method to record that a position at this ply was expanded into this many moves"""
+        while len(self.ply_nodes) <= ply:
+            self.ply_nodes.append(0)
+            self.ply_moves.append(0)
+        self.ply_nodes[ply] += 1
+        self.ply_moves[ply] += moves
+
+    def merge(self, other):
+        """Method to add another search's counters to these, such as one worker's share of a parallel search"""
+        for name in ('nodes', 'leaves', 'cutoffs', 'table_probes', 'table_hits', 'tablebase_hits', 'quiescence_nodes', 'generation_seconds', 'evaluation_seconds'):
+            setattr(self, name, getattr(self, name) + getattr(other, name))
+        self.depth = max(self.depth, other.depth)
+        self.max_ply = max(self.max_ply, other.max_ply)
+        self.aborted = self.aborted or other.aborted
+        while len(self.ply_nodes) < len(other.ply_nodes):
+            self.ply_nodes.append(0)
+            self.ply_moves.append(0)
+        for ply, (nodes, moves) in enumerate(zip(other.ply_nodes, other.ply_moves)):
+            self.ply_nodes[ply] += nodes
+            self.ply_moves[ply] += moves
+
+    def finish(self):
+        """Method to record the wall-clock time since the stats were created"""
+        self.seconds = time.perf_counter() - self.start
+
+    def toDict(self):
+        """Method to return the stats as a dict of plain values, ready for JSON"""
+        return {
+            'depth': self.depth,
+            'aborted': self.aborted,
+            'nodes': self.nodes,
+            'leaves': self.leaves,
+            'cutoffs': self.cutoffs,
+            'table_probes': self.table_probes,
+            'table_hits': self.table_hits,
+            'tablebase_hits': self.tablebase_hits,
+            'quiescence_nodes': self.quiescence_nodes,
+            'max_ply': self.max_ply,
+            'branching_factor': [moves / nodes if nodes else 0.0 for nodes, moves in zip(self.ply_nodes, self.ply_moves)],
+            'generation_seconds': self.generation_seconds,
+            'evaluation_seconds': self.evaluation_seconds,
+            'seconds': self.seconds,
+            'nodes_per_second': self.nodes / self.seconds if self.seconds else 0.0,
+        }
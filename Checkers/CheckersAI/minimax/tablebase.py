@@ -0,0 +1,233 @@
+"""
+Endgame tablebases: every position with up to N pieces solved to a
+win, loss or draw for the side to move, with the number of moves
+(plies) to the end of the game under best play.
+
+Generate a file from the Checkers directory with
+
+    python -m CheckersAI.minimax.tablebase --pieces 3 --output endgame.cktb
+
+Positions with fewer pieces are solved first, so captures always lead
+to positions that are already known. Within one piece count the
+positions are solved backwards from the lost ones (retrograde
+analysis); anything never reached that way is a draw. Moves come from
+the engine itself, so the tables follow exactly the rules the game
+plays by.
+
+The file holds a small header, the sorted 64-bit position keys and a
+16-bit result for each. It is memory-mapped and probed with a binary
+search, so opening it is instant and it is shared between processes.
+"""
+import argparse
+import bisect
+import itertools
+import mmap
+import struct
+import sys
+import time
+from array import array
+from pycheckers.constants import RED, WHITE
+from pycheckers.bitboard import BitBoard
+from pycheckers.snapshot import SQUARES
+from .algorithm import get_all_move_tuples
+
+DRAW, WIN, LOSS = 0, 1, 2 # Result for the side to move
+TABLEBASE_SCORE = 1000 # Search score of a win found in a tablebase, less one per ply to the win
+MAGIC = b'CKTB'
+HEADER = struct.Struct('<4sBBxxQ') # magic, version, max pieces, number of positions
+VERSION = 1
+# Red men can't stand on the top row and white men can't stand on the bottom row, they are crowned there
+INVALID_SQUARES = (frozenset(range(4)), frozenset(), frozenset(range(28, 32)), frozenset())
+
+def positionKey(masks, white_to_move):
+    """Function to pack a position into an integer: piece count, then square and type of each piece, then side to move"""
+    pieces = []
+    for piece_type, mask in enumerate(masks):
+        while mask:
+            lowest = mask & -mask
+            pieces.append(((lowest.bit_length() - 1) << 2) | piece_type)
+            mask ^= lowest
+    pieces.sort()
+    key = len(pieces)
+    for piece in pieces:
+        key = (key << 7) | piece
+    return (key << 1) | white_to_move
+
+def encode(result, distance):
+    """Function to pack a result and its distance into 16 bits"""
+    return (result << 14) | distance
+
+def decode(value):
+    """Function to unpack a 16-bit value into (result, distance)"""
+    return value >> 14, value & 0x3FFF
+
+class Tablebase:
+    """Class to probe a memory-mapped tablebase file"""
+    def __init__(self, path):
+        """Method to map the file and check its header"""
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, self.max_pieces, self.count = HEADER.unpack_from(self.map)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f'{path} is not a version {VERSION} checkers tablebase')
+        view = memoryview(self.map)
+        keys_start = HEADER.size
+        values_start = keys_start + 8 * self.count
+        self.keys = view[keys_start:values_start].cast('Q')
+        self.values = view[values_start:values_start + 2 * self.count].cast('H')
+        self.hits = self.misses = 0
+
+    def probe(self, board, white_to_move):
+        """Method to return (result, distance) for the side to move, or None if the position isn't covered"""
+        if board.red_pieces_remaining + board.white_pieces_remaining > self.max_pieces:
+            return None
+        key = positionKey(board.masks(), white_to_move)
+        index = bisect.bisect_left(self.keys, key)
+        if index < self.count and self.keys[index] == key:
+            self.hits += 1
+            return decode(self.values[index])
+        self.misses += 1
+        return None
+
+    def score(self, board, white_to_move):
+        """Method to return a search score (positive good for white) for a covered position, or None"""
+        if board.red_pieces_remaining == 0 or board.white_pieces_remaining == 0:
+            # The side to move has no pieces left, so it has just lost
+            result, distance = LOSS, 0
+        else:
+            entry = self.probe(board, white_to_move)
+            if entry is None:
+                return None
+            result, distance = entry
+        if result == DRAW:
+            return 0
+        score = TABLEBASE_SCORE - distance if result == WIN else distance - TABLEBASE_SCORE
+        return score if white_to_move else -score
+
+    def close(self):
+        """Method to unmap the file"""
+        self.keys.release()
+        self.values.release()
+        self.map.close()
+        self.file.close()
+
+def positionsWith(pieces):
+    """Function to yield the masks of every legal position with this many pieces, both colors present"""
+    for squares in itertools.combinations(range(SQUARES), pieces):
+        for piece_types in itertools.product(range(4), repeat=pieces):
+            if all(piece_type < 2 for piece_type in piece_types) or all(piece_type >= 2 for piece_type in piece_types):
+                continue
+            if any(square in INVALID_SQUARES[piece_type] for square, piece_type in zip(squares, piece_types)):
+                continue
+            masks = [0, 0, 0, 0]
+            for square, piece_type in zip(squares, piece_types):
+                masks[piece_type] |= 1 << square
+            yield tuple(masks)
+
+def solvePieceCount(pieces, solved):
+    """
+    Function to solve every position with exactly this many pieces, given
+    the results for all positions with fewer pieces in solved (key -> value).
+    Returns a dict of key -> encoded value for the new positions.
+    """
+    keys = []
+    successors = [] # In-table successor indices, filled once every key has an index
+    pending = [] # Successor keys per position before indices are known
+    best_loss = [] # Shortest known loss among successors outside this table, or None
+    longest_win = [] # Longest known win among successors outside this table
+    can_lose = [] # False once a successor is known not to be a win for the opponent
+    for masks in positionsWith(pieces):
+        for white_to_move in (False, True):
+            board = BitBoard.fromMasks(*masks)
+            color = WHITE if white_to_move else RED
+            in_table, loss, win, lose = [], None, -1, True
+            for piece, move, skip in get_all_move_tuples(board, color):
+                undo = board.make_move(piece, move[0], move[1], skip)
+                if board.red_pieces_remaining == 0 or board.white_pieces_remaining == 0:
+                    result, distance = LOSS, 0 # Captured the last piece
+                elif skip:
+                    result, distance = decode(solved[positionKey(board.masks(), not white_to_move)])
+                else:
+                    result, distance = None, None
+                    in_table.append(positionKey(board.masks(), not white_to_move))
+                board.undo_move(undo)
+                if result == LOSS:
+                    loss = distance if loss is None else min(loss, distance)
+                    lose = False
+                elif result == WIN:
+                    win = max(win, distance)
+                elif result == DRAW:
+                    lose = False
+            keys.append(positionKey(masks, white_to_move))
+            pending.append(in_table)
+            best_loss.append(loss)
+            longest_win.append(win)
+            can_lose.append(lose)
+    index = {key: position for position, key in enumerate(keys)}
+    predecessors = [[] for key in keys]
+    remaining = []
+    for position, in_table in enumerate(pending):
+        successors.append([index[key] for key in in_table])
+        remaining.append(len(in_table))
+        for successor in successors[-1]:
+            predecessors[successor].append(position)
+    del pending
+    # Bucket queue of (position, result) by distance, so every result is found at its shortest distance
+    buckets = {}
+    def push(distance, position, result):
+        buckets.setdefault(distance, []).append((position, result))
+    for position in range(len(keys)):
+        if best_loss[position] is not None:
+            push(best_loss[position] + 1, position, WIN)
+        if remaining[position] == 0 and can_lose[position]:
+            push(longest_win[position] + 1, position, LOSS) # No moves at all is a loss in 0
+    results = [None] * len(keys)
+    distance = 0
+    while buckets:
+        for position, result in buckets.pop(distance, []):
+            if results[position] is not None:
+                continue
+            results[position] = encode(result, distance)
+            for predecessor in predecessors[position]:
+                if results[predecessor] is not None:
+                    continue
+                if result == LOSS:
+                    push(distance + 1, predecessor, WIN)
+                else:
+                    remaining[predecessor] -= 1
+                    longest_win[predecessor] = max(longest_win[predecessor], distance)
+                    if remaining[predecessor] == 0 and can_lose[predecessor]:
+                        push(longest_win[predecessor] + 1, predecessor, LOSS)
+        distance += 1
+    return {key: DRAW if result is None else result for key, result in zip(keys, results)}
+
+def generate(max_pieces, path, log=print):
+    """Function to solve every position with 2 to max_pieces pieces and write the tablebase file"""
+    solved = {}
+    for pieces in range(2, max_pieces + 1):
+        start = time.perf_counter()
+        table = solvePieceCount(pieces, solved)
+        solved.update(table)
+        counts = [0, 0, 0]
+        for value in table.values():
+            counts[value >> 14] += 1
+        log(f'{pieces} pieces: {len(table)} positions, {counts[WIN]} wins, {counts[LOSS]} losses, {counts[DRAW]} draws in {time.perf_counter() - start:.1f}s')
+    keys = sorted(solved)
+    with open(path, 'wb') as file:
+        file.write(HEADER.pack(MAGIC, VERSION, max_pieces, len(keys)))
+        file.write(array('Q', keys).tobytes())
+        file.write(array('H', (solved[key] for key in keys)).tobytes())
+    return len(keys)
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate a checkers endgame tablebase')
+    parser.add_argument('--pieces', type=int, default=3, help='largest number of pieces on the board (at most 8)')
+    parser.add_argument('--output', default='endgame.cktb')
+    args = parser.parse_args()
+    if not 2 <= args.pieces <= 8:
+        sys.exit('--pieces must be between 2 and 8')
+    count = generate(args.pieces, args.output)
+    print(f'Wrote {count} positions to {args.output}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,50 @@
+EXACT, LOWER, UPPER = 0, 1, 2 # Whether a stored value is exact, a lower bound (fail high) or an upper bound (fail low)
+
+class TranspositionTable:
+    """
+    Bounded table of search results keyed by Zobrist hash. Each key maps
+    to one slot; when two positions compete for a slot the one searched
+    to the greater depth is kept (depth-preferred replacement).
+    """
+    def __init__(self, size=1 << 18):
+        """Method to initialize the table with room for size entries"""
+        self.size = size
+        self.slots = [None] * size
+        self.hits = self.misses = self.stores = self.overwrites = 0
+
+    def lookup(self, key):
+        """Method to return (depth, value, flag, best_index) stored for a position, or None"""
+        entry = self.slots[key % self.size]
+        if entry is not None and entry[0] == key:
+            self.hits += 1
+            return entry[1:]
+        self.misses += 1
+        return None
+
+    def store(self, key, depth, value, flag, best_index):
+        """Method to store a search result unless its slot holds a different position searched deeper"""
+        slot = key % self.size
+        entry = self.slots[slot]
+        if entry is not None and entry[0] != key:
+            if entry[1] > depth:
+                return
+            self.overwrites += 1
+        self.slots[slot] = (key, depth, value, flag, best_index)
+        self.stores += 1
+
+    def clear(self):
+        """Method to empty the table and reset its counters"""
+        self.slots = [None] * self.size
+        self.hits = self.misses = self.stores = self.overwrites = 0
+
+    def stats(self):
+        """Method to return the table's counters for tuning its size"""
+        probes = self.hits + self.misses
+        return {
+            'size': self.size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / probes if probes else 0.0,
+            'stores': self.stores,
+            'overwrites': self.overwrites,
+        }
@@ -0,0 +1,49 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from .algorithm import iterative_deepening
+
+class SearchHandle:
+    """Future-style handle for an AI search running in the background"""
+    def __init__(self, future, stop):
+        """Method to initialize handle variables"""
+        self.future = future
+        self.stop = stop
+
+    def done(self):
+        """Method to tell whether the search has finished, failed or been cancelled"""
+        return self.future.done()
+
+    def cancel(self):
+        """Method to ask the search to stop as soon as possible and throw its result away"""
+        self.stop.set()
+        self.future.cancel()
+
+    def cancelled(self):
+        """Method to tell whether cancel() was called"""
+        return self.stop.is_set()
+
+    def result(self):
+        """Method to return (value, new_board, depth) from iterative_deepening, waiting for it if needed"""
+        return self.future.result()
+
+class SearchWorker:
+    """Class to run AI searches on a background thread so the pygame loop keeps drawing while the AI thinks"""
+    def __init__(self, budget_ms, table=None, tablebase=None, evaluator=None, quiescence=False, on_stats=None):
+        """Method to initialize worker variables, on_stats is called on the worker thread with each iteration's search stats"""
+        self.budget_ms = budget_ms
+        self.table = table
+        self.tablebase = tablebase
+        self.evaluator = evaluator
+        self.quiescence = quiescence
+        self.on_stats = on_stats
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='checkers-ai')
+
+    def search(self, board, max_player, game):
+        """Method to start searching board and return a SearchHandle for the result, iterative_deepening searches its own copy"""
+        stop = threading.Event()
+        future = self.executor.submit(iterative_deepening, board, self.budget_ms, max_player, game, self.table, stop=stop, tablebase=self.tablebase, evaluator=self.evaluator, quiescence=self.quiescence, on_stats=self.on_stats)
+        return SearchHandle(future, stop)
+
+    def shutdown(self):
+        """Method to stop the worker thread, waiting for any cancelled search to unwind"""
+        self.executor.shutdown(wait=True, cancel_futures=True)
@@ -36,12 +36,18 @@ capturing optional. In almost all variants, the player
 without pieces remaining, or who cannot move due to being 
 blocked, loses the game.
 """
+import sys
+import time
 import pygame
-from pycheckers.constants import WIDTH, HEIGHT, SQUARE_SIZE, RED
+if not __package__:
+    # The pycheckers engine is shared with CheckersAI, so this file only runs as part of the Checkers directory
+    sys.exit('Run it from the Checkers directory with python -m CheckersGame.checkers')
+from pycheckers.constants import WIDTH, HEIGHT, SQUARE_SIZE
 from pycheckers.game import Game
 
 # Setting up pygame display
 FRAMES_PER_SECOND = 60
+GAME_RECORD_FILE = 'games.pdn' # Every game played is added to this file
 WINDOW = pygame.display.set_mode((WIDTH, HEIGHT))
 pygame.display.set_caption('Checkers by @wiknwo')
 
@@ -58,6 +64,7 @@ def main():
     run = True
     clock = pygame.time.Clock()
     game = Game(WINDOW)
+    game.record.tags.update(Event='Checkers', Date=time.strftime('%Y.%m.%d'), Black='Human', White='Human') # Red is Black in PDN
 
     while run:
         clock.tick(FRAMES_PER_SECOND)
@@ -73,6 +80,11 @@ def main():
                 row, column = getRowColumnFromMouse(mouse_position)
                 game.select(row, column)
         game.update()
+    if game.record.moves:
+        if game.winner() != None:
+            game.record.finish(game.winner())
+        with open(GAME_RECORD_FILE, 'a') as file:
+            file.write(str(game.record) + '\n')
     pygame.quit()
 
 if __name__ == '__main__':
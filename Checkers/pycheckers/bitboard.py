@@ -0,0 +1,174 @@
+from .constants import ROWS, COLUMNS, RED, WHITE
+from .board import Board
+
+# Board keeps one bit per square, row * COLUMNS + column, for every piece, for red pieces and for kings
+FULL = (1 << (ROWS * COLUMNS)) - 1
+LEFT_COLUMN = sum(1 << (row * COLUMNS) for row in range(ROWS))
+RIGHT_COLUMN = LEFT_COLUMN << (COLUMNS - 1)
+TOP_ROW = (1 << COLUMNS) - 1
+
+# Shift-mask steps moving every bit in a mask one square along a diagonal at once, dropping bits that would leave the board
+def upLeft(bits):
+    return (bits & ~LEFT_COLUMN) >> (COLUMNS + 1)
+
+def upRight(bits):
+    return (bits & ~RIGHT_COLUMN) >> (COLUMNS - 1)
+
+def downLeft(bits):
+    return ((bits & ~LEFT_COLUMN) << (COLUMNS - 1)) & FULL
+
+def downRight(bits):
+    return ((bits & ~RIGHT_COLUMN) << (COLUMNS + 1)) & FULL
+
+UP = ((upLeft, downRight), (upRight, downLeft)) # (step, opposite step) for the left and right diagonal
+DOWN = ((downLeft, upRight), (downRight, upLeft))
+
+def _neighbours(step):
+    """Function to tabulate the single square a step reaches from each square, 0 when it leaves the board"""
+    return [step(1 << square) for square in range(ROWS * COLUMNS)]
+
+UP_NEIGHBOURS = (_neighbours(upLeft), _neighbours(upRight))
+DOWN_NEIGHBOURS = (_neighbours(downLeft), _neighbours(downRight))
+
+class BitBoard(Board):
+    """
+    Checkers board that generates moves with bitboards. Board already
+    keeps one bit per square for every piece, for red pieces and for
+    kings, and BitBoard shifts those masks instead of walking the grid:
+    get_move_tuples finds every plain move and every first jump of a
+    side at once and only follows capture chains piece by piece. Moves
+    are identical to the ones Board generates, in the same order.
+    """
+    ######################### AI Methods #########################
+    def get_all_pieces(self, color):
+        """Method to return all pieces of a specific color"""
+        return self.__piecesOn(self.red_occupied if color == RED else self.occupied ^ self.red_occupied)
+
+    def get_movable_pieces(self, color):
+        """Method to return the pieces of a specific color that have at least one move, found for all pieces at once with shifts"""
+        movable = 0
+        for neighbours, continuations, steps, jumps in self.__sideMoves(color)[1]:
+            movable |= steps | jumps
+        return self.__piecesOn(movable)
+
+    def get_move_tuples(self, color):
+        """Method to return (piece, move, skip) for every move of a side, in the order Board gives them"""
+        own, directions = self.__sideMoves(color)
+        movable = 0
+        for neighbours, continuations, steps, jumps in directions:
+            movable |= steps | jumps
+        move_tuples = []
+        while movable:
+            bit = movable & -movable
+            movable ^= bit
+            square = bit.bit_length() - 1
+            moves = {}
+            for neighbours, continuations, steps, jumps in directions:
+                if bit & steps:
+                    moves[divmod(neighbours[square].bit_length() - 1, COLUMNS)] = []
+                elif bit & jumps:
+                    self.__jump(moves, neighbours[square], neighbours, continuations, own)
+            piece = self.board[square // COLUMNS][square % COLUMNS]
+            for move, skip in moves.items():
+                move_tuples.append((piece, move, skip))
+        return move_tuples
+
+    def get_capture_tuples(self, color):
+        """Method to return (piece, move, skip) for every capture of a side, only following pieces that can make a first jump"""
+        own, directions = self.__sideMoves(color)
+        jumpers = 0
+        for neighbours, continuations, steps, jumps in directions:
+            jumpers |= jumps
+        capture_tuples = []
+        while jumpers:
+            bit = jumpers & -jumpers
+            jumpers ^= bit
+            square = bit.bit_length() - 1
+            moves = {}
+            for neighbours, continuations, steps, jumps in directions:
+                if bit & jumps:
+                    self.__jump(moves, neighbours[square], neighbours, continuations, own)
+            piece = self.board[square // COLUMNS][square % COLUMNS]
+            for move, skip in moves.items():
+                capture_tuples.append((piece, move, skip))
+        return capture_tuples
+
+    def __sideMoves(self, color):
+        """
+        Private method to return (own, directions) for a side, with one (neighbours, continuations, steps, jumps) entry
+        per diagonal in the order Board looks along them. steps and jumps are the masks of the side's pieces with a
+        plain move or a first jump along that diagonal.
+        """
+        occupied = self.occupied
+        empty = FULL & ~occupied
+        if color == RED:
+            own = self.red_occupied
+            up_movers, down_movers = own, own & self.king_occupied
+        else:
+            own = occupied ^ self.red_occupied
+            up_movers, down_movers = own & self.king_occupied, own
+        opponents = occupied ^ own
+        directions = []
+        for movers, steps, tables in ((up_movers, UP, UP_NEIGHBOURS), (down_movers, DOWN, DOWN_NEIGHBOURS)):
+            for (step, opposite), neighbours in zip(steps, tables):
+                # A piece steps if the next square is empty, or jumps if it holds an opponent with an empty square beyond
+                directions.append((neighbours, tables, movers & opposite(empty), movers & opposite(opposite(empty) & opponents)))
+        return own, directions
+
+    def __jump(self, moves, bit, neighbours, continuations, own):
+        """Private method to add the first jump over the opponent on bit to moves, with every jump that can follow it"""
+        square = bit.bit_length() - 1
+        jumped = [self.board[square // COLUMNS][square % COLUMNS]]
+        landing = neighbours[square]
+        moves[divmod(landing.bit_length() - 1, COLUMNS)] = jumped
+        for continuation in continuations:
+            moves.update(self.__traverse(landing, continuation, continuations, own, jumped))
+
+    def __piecesOn(self, bits):
+        """Private method to return the pieces on the squares of a mask in row-major order"""
+        pieces = []
+        while bits:
+            lowest = bits & -bits
+            square = lowest.bit_length() - 1
+            pieces.append(self.board[square // COLUMNS][square % COLUMNS])
+            bits ^= lowest
+        return pieces
+    ######################### AI Methods #########################
+
+    def getValidMoves(self, piece):
+        """Method to determine valid moves for piece, producing the same moves in the same order as Board.findValidMoves"""
+        moves = {} # key: (row, column), value: []
+        bit = 1 << (piece.row * COLUMNS + piece.column)
+        own = self.red_occupied if piece.color == RED else self.occupied ^ self.red_occupied
+        if piece.color == RED or piece.isKing:
+            for neighbours in UP_NEIGHBOURS:
+                moves.update(self.__traverse(bit, neighbours, UP_NEIGHBOURS, own, []))
+        if piece.color == WHITE or piece.isKing:
+            for neighbours in DOWN_NEIGHBOURS:
+                moves.update(self.__traverse(bit, neighbours, DOWN_NEIGHBOURS, own, []))
+        return moves
+
+    def __traverse(self, bit, neighbours, continuations, own, skipped):
+        """Private method to look up to two squares along one diagonal for a step or a jump, following further jumps"""
+        moves = {}
+        last = [] # Piece we would skip to move to where we want to go
+        # Continuing a jump upwards never lands on the top row, matching Board's traversal
+        allowed = FULL & ~TOP_ROW if skipped and continuations is UP_NEIGHBOURS else FULL
+        for _ in range(2):
+            bit = neighbours[bit.bit_length() - 1] & allowed
+            if not bit:
+                break
+            if not bit & self.occupied: # We found a blank square
+                if skipped and not last: # Only another jump can continue a jump
+                    break
+                moves[divmod(bit.bit_length() - 1, COLUMNS)] = last + skipped if skipped else last
+                if last:
+                    for continuation in continuations:
+                        moves.update(self.__traverse(bit, continuation, continuations, own, last))
+                break
+            elif bit & own: # Piece we are trying to move to is same color as our piece then we can't move
+                break
+            else: # Opponent piece we could jump over if the square beyond it is blank
+                square = bit.bit_length() - 1
+                last = [self.board[square // COLUMNS][square % COLUMNS]]
+        return moves
@@ -0,0 +1,322 @@
+from .constants import ROWS, COLUMNS, RED, WHITE # .constants because when we are in same directory as something else, we are specifying that we are making a relative import
+from .piece import Piece
+from .zobrist import pieceKey, kingCountKey
+from .evaluation import pieceFeatures, INCREMENTAL_FEATURES
+from .snapshot import Snapshot, SQUARES, SQUARE_POSITIONS
+
+def _near(row, column):
+    """Function to return a mask, one bit per square, of the squares one and two steps away from a square along its diagonals"""
+    mask = 0
+    for row_step, column_step in ((-1, -1), (-1, 1), (1, -1), (1, 1)):
+        for distance in (1, 2):
+            near_row, near_column = row + row_step * distance, column + column_step * distance
+            if 0 <= near_row < ROWS and 0 <= near_column < COLUMNS:
+                mask |= 1 << (near_row * COLUMNS + near_column)
+    return mask
+
+# Every square move generation looks at from a square, for a step or a jump, so cached moves only depend on these
+NEAR = [[_near(row, column) for column in range(COLUMNS)] for row in range(ROWS)]
+
+class Board:
+    """Class representing Checkers board of size 8x8"""
+    def __init__(self):
+        """Method to initialize board variables"""
+        self.board = []
+        self.red_pieces_remaining = self.white_pieces_remaining = 12
+        self.red_kings = self.white_kings = 0
+        self.hash = 0 # Zobrist hash of the pieces and king counters, kept up to date by move and remove
+        self.features = [0] * INCREMENTAL_FEATURES # Evaluation feature sums, kept up to date by move and remove
+        self.occupied = self.red_occupied = self.king_occupied = 0 # One bit per square, row * COLUMNS + column, for every piece, red pieces and kings
+        self.move_cache = {} # (row, column): (color, isKing, squares read, occupied of those, red of those, moves, captured squares)
+        self.createBoard()
+
+    @classmethod
+    def fromMasks(cls, red_men, red_kings, white_men, white_kings, red_king_counter=None, white_king_counter=None):
+        """
+        Method to create a board holding exactly the pieces in the four masks (bit = row * 4 + column // 2).
+        The king counters default to the number of kings on the board.
+        """
+        board = cls.__new__(cls)
+        board.board = [[0] * COLUMNS for row in range(ROWS)]
+        board.hash = 0
+        board.features = [0] * INCREMENTAL_FEATURES
+        board.occupied = board.red_occupied = board.king_occupied = 0
+        board.move_cache = {}
+        for mask, color, isKing in ((red_men, RED, False), (red_kings, RED, True), (white_men, WHITE, False), (white_kings, WHITE, True)):
+            for square in range(SQUARES):
+                if mask >> square & 1:
+                    row, column = SQUARE_POSITIONS[square]
+                    piece = Piece(row, column, color)
+                    piece.isKing = isKing
+                    board.board[row][column] = piece
+                    board.occupied |= 1 << (row * COLUMNS + column)
+                    if color == RED:
+                        board.red_occupied |= 1 << (row * COLUMNS + column)
+                    if isKing:
+                        board.king_occupied |= 1 << (row * COLUMNS + column)
+                    board.hash ^= pieceKey(piece)
+                    board.__addFeatures(piece, 1)
+        board.red_pieces_remaining = bin(red_men | red_kings).count('1')
+        board.white_pieces_remaining = bin(white_men | white_kings).count('1')
+        board.red_kings = bin(red_kings).count('1') if red_king_counter is None else red_king_counter
+        board.white_kings = bin(white_kings).count('1') if white_king_counter is None else white_king_counter
+        board.hash ^= kingCountKey(RED, board.red_kings) ^ kingCountKey(WHITE, board.white_kings)
+        return board
+
+    @classmethod
+    def fromSnapshot(cls, snapshot):
+        """Method to create a board from a Snapshot"""
+        return cls.fromMasks(*snapshot.masks(), *snapshot.kingCounters())
+
+    def snapshot(self):
+        """Method to return an immutable Snapshot of the position"""
+        return Snapshot.pack(self.masks(), self.red_kings, self.white_kings)
+
+    def copy(self):
+        """Method to return an independent board in the same position, with new piece objects"""
+        return self.fromSnapshot(self.snapshot())
+
+    def masks(self):
+        """Method to return the red men, red kings, white men and white kings masks"""
+        masks = [0, 0, 0, 0]
+        for square, (row, column) in enumerate(SQUARE_POSITIONS):
+            piece = self.board[row][column]
+            if piece != 0:
+                masks[(0 if piece.color == RED else 2) + piece.isKing] |= 1 << square
+        return tuple(masks)
+    
+    ######################### AI Methods #########################
+    def evaluate(self):
+        """Method to tell us, given state of board, what is its score. Could multiply kings by factor of 1.5 to see difference."""
+        return self.white_pieces_remaining - self.red_pieces_remaining + (self.white_kings * 0.5 - self.red_kings * 0.5)
+
+    def get_all_pieces(self, color):
+        """Method to return all pieces of a specific color"""
+        pieces = []
+        for row in self.board:
+            for piece in row:
+                if piece != 0 and piece.color == color:
+                    pieces.append(piece)
+        return pieces
+
+    def get_movable_pieces(self, color):
+        """Method to return the pieces of a specific color that have at least one move, for mobility"""
+        return [piece for piece in self.get_all_pieces(color) if self.getValidMoves(piece)]
+
+    def get_move_tuples(self, color):
+        """Method to return (piece, move, skip) for every move of a side, piece by piece in row-major order"""
+        move_tuples = []
+        for piece in self.get_all_pieces(color):
+            for move, skip in self.getValidMoves(piece).items():
+                # move = (row, column), skip = [pieces to skip]
+                move_tuples.append((piece, move, skip))
+        return move_tuples
+
+    def make_move(self, piece, row, column, skipped):
+        """Method to make a move in place and return the record needed to undo it"""
+        undo = (piece, piece.row, piece.column, piece.isKing, skipped,
+                (self.red_pieces_remaining, self.white_pieces_remaining, self.red_kings, self.white_kings, self.hash), tuple(self.features),
+                (self.occupied, self.red_occupied, self.king_occupied))
+        self.move(piece, row, column)
+        if skipped:
+            self.remove(skipped)
+        return undo
+
+    def undo_move(self, undo):
+        """Method to take back a move made with make_move, restoring captured pieces, promotion and piece counters"""
+        piece, row, column, isKing, skipped, counters, features, occupied = undo
+        self.board[piece.row][piece.column], self.board[row][column] = self.board[row][column], self.board[piece.row][piece.column]
+        piece.move(row, column)
+        piece.isKing = isKing
+        for skipped_piece in skipped:
+            self.board[skipped_piece.row][skipped_piece.column] = skipped_piece
+        self.red_pieces_remaining, self.white_pieces_remaining, self.red_kings, self.white_kings, self.hash = counters
+        self.features[:] = features
+        self.occupied, self.red_occupied, self.king_occupied = occupied
+
+    def get_capture_tuples(self, color):
+        """Method to return (piece, move, skip) for every capture of a side, in the order get_move_tuples gives them"""
+        return [(piece, move, skip) for piece, move, skip in self.get_move_tuples(color) if skip]
+    ######################### AI Methods #########################
+
+    def move(self, piece, row, column):
+        """Method to move piece by deleting piece from where it is and changing its position"""
+        bits = 1 << (piece.row * COLUMNS + piece.column) | 1 << (row * COLUMNS + column)
+        self.occupied ^= bits
+        if piece.color == RED:
+            self.red_occupied ^= bits
+        if piece.isKing:
+            self.king_occupied ^= bits
+        self.hash ^= pieceKey(piece)
+        self.__addFeatures(piece, -1)
+        self.board[piece.row][piece.column], self.board[row][column] = self.board[row][column], self.board[piece.row][piece.column]
+        piece.move(row, column)
+        # Checking if we move into first or last row to see if piece should become king
+        if row == ROWS - 1 or row == 0:
+            piece.makeKing()
+            self.king_occupied |= 1 << (row * COLUMNS + column)
+            if piece.color == WHITE:
+                self.hash ^= kingCountKey(WHITE, self.white_kings) ^ kingCountKey(WHITE, self.white_kings + 1)
+                self.white_kings += 1
+            elif piece.color == RED:
+                self.hash ^= kingCountKey(RED, self.red_kings) ^ kingCountKey(RED, self.red_kings + 1)
+                self.red_kings += 1
+        self.hash ^= pieceKey(piece)
+        self.__addFeatures(piece, 1)
+
+    def __addFeatures(self, piece, sign):
+        """Private method to add (sign 1) or take away (sign -1) a piece's contribution to the evaluation features"""
+        features = self.features
+        for index, feature in enumerate(pieceFeatures(piece)):
+            features[index] += sign * feature
+    
+    def getPiece(self, row, column):
+        """Method to get piece on board"""
+        return self.board[row][column]
+
+    def createBoard(self):
+        """Method to create pieces with white at top and red at bottom"""
+        for row_index in range(ROWS):
+            self.board.append([]) # Want interior lists for each row
+            for column_index in range(COLUMNS):
+                if column_index % 2 == ((row_index + 1) % 2):
+                    if row_index < 3:
+                        self.board[row_index].append(Piece(row_index, column_index, WHITE))
+                    elif row_index > 4:
+                        self.board[row_index].append(Piece(row_index, column_index, RED))
+                    else:
+                        self.board[row_index].append(0) # Blank piece
+                else:
+                    self.board[row_index].append(0)
+                if self.board[row_index][column_index] != 0:
+                    self.occupied |= 1 << (row_index * COLUMNS + column_index)
+                    if self.board[row_index][column_index].color == RED:
+                        self.red_occupied |= 1 << (row_index * COLUMNS + column_index)
+                    self.hash ^= pieceKey(self.board[row_index][column_index])
+                    self.__addFeatures(self.board[row_index][column_index], 1)
+
+    def remove(self, pieces):
+        """Method to remove all specified pieces from board"""
+        for piece in pieces:
+            self.board[piece.row][piece.column] = 0
+            if piece != 0:
+                self.occupied &= ~(1 << (piece.row * COLUMNS + piece.column))
+                self.red_occupied &= ~(1 << (piece.row * COLUMNS + piece.column))
+                self.king_occupied &= ~(1 << (piece.row * COLUMNS + piece.column))
+                self.hash ^= pieceKey(piece)
+                self.__addFeatures(piece, -1)
+                if piece.color == RED:
+                    self.red_pieces_remaining -= 1
+                else:
+                    self.white_pieces_remaining -= 1
+
+    def declareWinner(self):
+        """Method to determine who won the checkers game"""
+        if self.red_pieces_remaining <= 0:
+            return WHITE
+        elif self.white_pieces_remaining <= 0:
+            return RED
+        return None
+    
+    def getValidMoves(self, piece):
+        """
+        Method to return the valid moves for piece, reusing the moves last found on its square
+        while the same kind of piece stands there and none of the squares it looked at have changed
+        """
+        cached = self.move_cache.get((piece.row, piece.column))
+        if cached is not None and cached[0] == piece.color and cached[1] == piece.isKing:
+            color, isKing, reads, occupied, red, moves, captured = cached
+            if self.occupied & reads == occupied and self.red_occupied & reads == red:
+                if captured is None:
+                    return moves
+                # Jumped pieces are stored as squares since another piece object may stand there now
+                return {move: [self.board[row][column] for row, column in squares] for move, squares in captured.items()}
+        moves = self.findValidMoves(piece)
+        reads = NEAR[piece.row][piece.column]
+        captured = None
+        if any(moves.values()):
+            # A jump goes on looking for further jumps from where it lands
+            for (row, column), skip in moves.items():
+                if skip:
+                    reads |= NEAR[row][column]
+            captured = {move: [(skipped.row, skipped.column) for skipped in skip] for move, skip in moves.items()}
+        self.move_cache[(piece.row, piece.column)] = (piece.color, piece.isKing, reads, self.occupied & reads, self.red_occupied & reads, moves, captured)
+        return moves
+
+    def findValidMoves(self, piece):
+        """Method to perform part of algorithm that determines valid moves for piece"""
+        # Red pieces are at the bottom so direction they are moving is negative with respect to pygame coordinate system
+        # White pieces are at the top so direction they are moving is positive with respect to pygame coordinate system
+        moves = {} # key: (row, column), value: []
+        left = piece.column - 1
+        right = piece.column + 1
+        row = piece.row
+        if piece.color == RED or piece.isKing:
+            moves.update(self.__traverse_left(row - 1, max(row - 3, -1), -1, piece.color, left))
+            moves.update(self.__traverse_right(row - 1, max(row - 3, -1), -1, piece.color, right))
+        if piece.color == WHITE or piece.isKing:
+            moves.update(self.__traverse_left(row + 1, min(row + 3, ROWS), 1, piece.color, left))
+            moves.update(self.__traverse_right(row + 1, min(row + 3, ROWS), 1, piece.color, right))
+        return moves
+
+    def __traverse_left(self, start, stop, step, color, left, skipped = None):
+        """Private method that implements part of the algorithm to determine valid moves of a piece"""
+        moves = {}
+        last = [] # Piece we would skip to move to where we want to go
+        for row_index in range(start, stop, step):
+            if left < 0:
+                break
+            current = self.board[row_index][left]
+            if current == 0: # We found a blank square
+                row = 8 # Initialize row using 8 as sentinel
+                if skipped and not last: # We skipped over something, we found a blank square and we don't have anything we can skip again then we can't move there
+                    break
+                elif skipped:
+                    moves[(row_index, left)] = last + skipped # Double jumping
+                else:
+                    moves[(row_index, left)] = last
+                if last:
+                    if step == -1:
+                        row = max(row_index - 3, 0)
+                    else:
+                        row = min(row_index + 3, ROWS)
+                    moves.update(self.__traverse_left(row_index + step, row, step, color, left - 1, skipped = last))
+                    moves.update(self.__traverse_right(row_index + step, row, step, color, left + 1, skipped = last))
+                break            
+            elif current.color == color: # Piece we are trying to move to is same color as our piece then we can't move
+                break
+            else: # Piece is not our color so we could potentially jump over it if there is a blank square adjacent to it
+                last = [current]
+            left -= 1
+        return moves
+
+    def __traverse_right(self, start, stop, step, color, right, skipped = None):
+        """Private method that implements part of the algorithm to determine valid moves of a piece"""
+        moves = {}
+        last = [] # Piece we would skip to move to where we want to go
+        for row_index in range(start, stop, step):
+            if right >= COLUMNS:
+                break
+            current = self.board[row_index][right]
+            if current == 0: # We found a blank square
+                row = 8 # Initialize row using 8 as sentinel
+                if skipped and not last: # We skipped over something, we found a blank square and we don't have anything we can skip again then we can't move there
+                    break
+                elif skipped:
+                    moves[(row_index, right)] = last + skipped # Double jumping
+                else:
+                    moves[(row_index, right)] = last
+                if last:
+                    if step == -1:
+                        row = max(row_index - 3, 0)
+                    else:
+                        row = min(row_index + 3, ROWS)
+                    moves.update(self.__traverse_left(row_index + step, row, step, color, right - 1, skipped = last))
+                    moves.update(self.__traverse_right(row_index + step, row, step, color, right + 1, skipped = last))
+                break            
+            elif current.color == color: # Piece we are trying to move to is same color as our piece then we can't move
+                break
+            else: # Piece is not our color so we could potentially jump over it if there is a blank square adjacent to it
+                last = [current]
+            right += 1
+        return moves
\ No newline at end of file
@@ -0,0 +1,11 @@
+# Display settings
+WIDTH, HEIGHT = 600, 600
+ROWS, COLUMNS = 8, 8
+SQUARE_SIZE = WIDTH // COLUMNS
+
+# Colors
+RED = (255, 0, 0)
+WHITE = (255, 255, 255)
+BLACK = (0, 0, 0)
+BLUE = (0, 0, 255)
+GREY = (128, 128, 128)
\ No newline at end of file
@@ -0,0 +1,60 @@
+from .constants import ROWS, COLUMNS, RED, WHITE
+
+# Features are scored from white's point of view: white pieces add, red pieces subtract
+FEATURES = ('material', 'kings', 'advancement', 'back_rank', 'center', 'mobility')
+INCREMENTAL_FEATURES = len(FEATURES) - 1 # Every feature but mobility is a sum over pieces kept up to date by Board
+DEFAULT_WEIGHTS = {'material': 1.0, 'kings': 0.5, 'advancement': 0.02, 'back_rank': 0.1, 'center': 0.05, 'mobility': 0.0}
+
+def _pieceFeatures(row, column, color, isKing):
+    """Function to return what one piece on one square adds to each incremental feature"""
+    sign = 1 if color == WHITE else -1
+    advancement = 0 if isKing else (row if color == WHITE else ROWS - 1 - row)
+    back_rank = not isKing and row == (0 if color == WHITE else ROWS - 1)
+    center = 3 <= row <= 4 and 2 <= column <= 5
+    return tuple(sign * feature for feature in (1, isKing, advancement, back_rank, center))
+
+# PIECE_FEATURES[color is white][isKing][row][column]
+PIECE_FEATURES = [[[[_pieceFeatures(row, column, color, isKing) for column in range(COLUMNS)] for row in range(ROWS)]
+                   for isKing in (False, True)] for color in (RED, WHITE)]
+
+def pieceFeatures(piece):
+    """Function to return what a piece on its current square adds to each incremental feature"""
+    return PIECE_FEATURES[piece.color == WHITE][piece.isKing][piece.row][piece.column]
+
+class Evaluator:
+    """
+    Weighted sum of board features, used by the search in place of
+    Board.evaluate. The per-piece features are kept up to date by the
+    board as pieces move, so a leaf costs one short dot product however
+    many features there are. Mobility needs move generation, so it is
+    only computed when its weight is not zero.
+    """
+    def __init__(self, weights=None):
+        """Method to initialize the weights, any feature not given keeps its default weight"""
+        weights = dict(DEFAULT_WEIGHTS, **(weights or {}))
+        unknown = set(weights) - set(FEATURES)
+        if unknown:
+            raise ValueError(f'Unknown evaluation features: {sorted(unknown)}')
+        self.weights = tuple(weights[feature] for feature in FEATURES)
+        self.incremental_weights = self.weights[:INCREMENTAL_FEATURES]
+        self.mobility_weight = self.weights[-1]
+
+    def evaluate(self, board):
+        """Method to score a board, positive is good for white"""
+        score = sum(weight * feature for weight, feature in zip(self.incremental_weights, board.features))
+        if self.mobility_weight:
+            score += self.mobility_weight * mobility(board)
+        return score
+
+    def featuresOf(self, board):
+        """Method to return every feature of a board, mobility included, for batch evaluation"""
+        return tuple(board.features) + (mobility(board) if self.mobility_weight else 0,)
+
+    def evaluate_batch(self, features):
+        """Method to score many positions at once from a sequence of featuresOf() rows, returning a NumPy array"""
+        import numpy as np # Only needed for batch evaluation
+        return np.asarray(features, dtype=np.float64).reshape(-1, len(FEATURES)) @ np.asarray(self.weights)
+
+def mobility(board):
+    """Function to return how many more white pieces than red pieces can move"""
+    return len(board.get_movable_pieces(WHITE)) - len(board.get_movable_pieces(RED))
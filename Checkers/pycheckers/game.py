@@ -1,26 +1,33 @@
 import pygame
-from .constants import RED, SQUARE_SIZE, WHITE, BLUE
+from .constants import RED, WHITE
 from .board import Board
+from .render import BoardRenderer
+from .pdn import GameRecord, moveBetween
 
 class Game:
     """Class to handle game logic and interfacing with board and pieces"""
-    def __init__(self, window):
-        """Method to initialize game variables"""
+    def __init__(self, window, board_class=Board):
+        """Method to initialize game variables, board_class lets a different board backend such as BitBoard be used"""
+        self.board_class = board_class
         self.__init()
         self.window = window
+        self.renderer = BoardRenderer(window)
     
     def update(self):
-        """Method to update the game's display"""
-        self.board.draw(self.window)
-        self.drawValidMoves(self.valid_moves)
-        pygame.display.update()
+        """Method to update the game's display, sending only the squares that changed to the screen"""
+        self.poll_ai_move()
+        rects = self.renderer.draw(self.board, self.valid_moves)
+        if rects:
+            pygame.display.update(rects)
 
     def __init(self):
         """Private method to intialize game variables"""
         self.selected_piece = None
-        self.board = Board()
+        self.board = self.board_class()
         self.turn = RED
         self.valid_moves = {}
+        self.ai_search = None
+        self.record = GameRecord() # Every move played, for saving as PDN
 
     def winner(self):
         """Method to call declareWinner() from board class"""
@@ -28,6 +35,7 @@ class Game:
 
     def reset(self):
         """Method to reset game variables"""
+        self.cancel_ai_move()
         self.__init()
 
     def select(self, row, column):
@@ -49,8 +57,9 @@ class Game:
         """Private method to attempt to move piece to valid position"""
         piece = self.board.getPiece(row, column)
         if self.selected_piece and piece == 0 and (row, column) in self.valid_moves:
-            self.board.move(self.selected_piece, row, column)
             skipped = self.valid_moves[(row, column)]
+            self.record.addMove((self.selected_piece.row, self.selected_piece.column), (row, column), skipped)
+            self.board.move(self.selected_piece, row, column)
             if skipped:
                 self.board.remove(skipped)
             self.changeTurn()
@@ -58,12 +67,6 @@ class Game:
             return False
         return True
 
-    def drawValidMoves(self, moves):
-        """Method to draw circles for each of the valid moves"""
-        for move in moves:
-            row, column = move
-            pygame.draw.circle(self.window, BLUE, (column * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2), 15)
-
     def changeTurn(self):
         """Method to change player turn"""
         self.valid_moves = {}
@@ -79,6 +82,33 @@ class Game:
 
     def ai_move(self, board):
         """AI makes move and returns the new board after it has made its move"""
+        self.record.addMove(*moveBetween(self.board.masks(), board.masks(), self.turn == WHITE))
         self.board = board
         self.changeTurn()
+
+    def request_ai_move(self, handle):
+        """Method to remember a background AI search, its move is played by poll_ai_move once it finishes"""
+        self.ai_search = handle
+
+    def ai_thinking(self):
+        """Method to tell whether a background AI search is still running"""
+        return self.ai_search is not None
+
+    def poll_ai_move(self):
+        """Method to play the AI's move if its background search has finished, returns True if a move was played"""
+        if self.ai_search is None or not self.ai_search.done():
+            return False
+        handle = self.ai_search
+        self.ai_search = None
+        if handle.cancelled():
+            return False
+        value, new_board, depth = handle.result()
+        self.ai_move(new_board)
+        return True
+
+    def cancel_ai_move(self):
+        """Method to cancel a background AI search, for example when the game is reset or closed"""
+        if self.ai_search is not None:
+            self.ai_search.cancel()
+            self.ai_search = None
     ######################### AI Methods #########################
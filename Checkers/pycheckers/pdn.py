@@ -0,0 +1,156 @@
+"""
+Game records in PDN (portable draughts notation).
+
+Squares are numbered 1 to 32 as on a standard checkers diagram, seen
+from the side that moves first. Red moves first here, so red is PDN's
+Black, starting on squares 1-12, and white is PDN's White, starting on
+squares 21-32. A move is written 11-15 and a capture 15x24, from the
+starting square to the final one. A result of 1-0 means red won,
+0-1 means white won and 1/2-1/2 is a draw.
+
+    [Event "Checkers"]
+    [Black "Human"]
+    [White "AI"]
+    [Result "0-1"]
+
+    1. 11-15 23-19 2. 8-11 22-17 ... 0-1
+"""
+import re
+from .constants import RED, WHITE
+from .board import Board
+from .snapshot import SQUARES, SQUARE_POSITIONS
+
+RESULTS = {RED: '1-0', WHITE: '0-1', None: '1/2-1/2'}
+UNFINISHED = '*'
+TAG = re.compile(r'\[(\w+)\s+"((?:[^"\\]|\\.)*)"\]')
+MOVE = re.compile(r'(\d+)(?:([-x])(\d+))+') # Only the first and last squares of a move are used
+
+def squareNumber(row, column):
+    """Function to return the PDN number (1-32) of a dark square"""
+    return SQUARES - (row * 4 + column // 2)
+
+def squarePosition(number):
+    """Function to return the (row, column) of a PDN square number"""
+    if not 1 <= number <= SQUARES:
+        raise ValueError(f'PDN squares are numbered 1 to {SQUARES}, not {number}')
+    return SQUARE_POSITIONS[SQUARES - number]
+
+def formatMove(start, destination, capture):
+    """Function to write a move between two PDN square numbers, 11-15 or 15x24 for a capture"""
+    return f'{start}{"x" if capture else "-"}{destination}'
+
+def moveBetween(before, after, white):
+    """
+    Function to work out the move that turned one position into another, given the
+    (red men, red kings, white men, white kings) masks of both. Returns
+    ((from row, from column), (to row, to column), [captured (row, column)]).
+    """
+    own, opponent = (slice(2, 4), slice(0, 2)) if white else (slice(0, 2), slice(2, 4))
+    own_before, own_after = before[own][0] | before[own][1], after[own][0] | after[own][1]
+    captured = (before[opponent][0] | before[opponent][1]) & ~(after[opponent][0] | after[opponent][1])
+    start = SQUARE_POSITIONS[(own_before & ~own_after).bit_length() - 1]
+    destination = SQUARE_POSITIONS[(own_after & ~own_before).bit_length() - 1]
+    return start, destination, [SQUARE_POSITIONS[square] for square in range(SQUARES) if captured >> square & 1]
+
+class GameRecord:
+    """Class to record the moves of one game and read and write them as PDN"""
+    def __init__(self, tags=None):
+        """Method to initialize record variables"""
+        self.tags = dict(tags or {})
+        self.moves = [] # (from square number, to square number, capture)
+        self.result = UNFINISHED
+
+    def addMove(self, start, destination, skipped):
+        """Method to record a move from (row, column) start to destination, skipped being the pieces or squares it jumps"""
+        self.moves.append((squareNumber(*start), squareNumber(*destination), bool(skipped)))
+
+    def finish(self, winner):
+        """Method to record the result: RED or WHITE for a win, None for a draw"""
+        self.result = RESULTS[winner]
+
+    def moveText(self, index):
+        """Method to return a recorded move written as PDN"""
+        return formatMove(*self.moves[index])
+
+    def __str__(self):
+        """Method to return the game as PDN text"""
+        tags = dict(self.tags, Result=self.result)
+        lines = [f'[{name} "{value}"]' for name, value in tags.items()]
+        words = []
+        for index in range(len(self.moves)):
+            if index % 2 == 0:
+                words.append(f'{index // 2 + 1}.')
+            words.append(self.moveText(index))
+        words.append(self.result)
+        lines.append('')
+        lines.append(' '.join(words))
+        return '\n'.join(lines) + '\n'
+
+    @classmethod
+    def parse(cls, text):
+        """Method to read one game of PDN text, raising ValueError if it holds no moves or result"""
+        record = cls({name: value for name, value in TAG.findall(text)})
+        movetext = TAG.sub(' ', text)
+        movetext = re.sub(r'\{[^}]*\}|\([^)]*\)', ' ', movetext) # Comments and variations
+        for word in movetext.split():
+            if word in RESULTS.values() or word == UNFINISHED:
+                record.result = word
+                break
+            if re.fullmatch(r'\d+\.+', word):
+                continue # Move number
+            match = MOVE.fullmatch(word)
+            if match is None:
+                raise ValueError(f'Cannot read PDN move {word!r}')
+            numbers = re.findall(r'\d+', word)
+            record.moves.append((int(numbers[0]), int(numbers[-1]), 'x' in word))
+        if not record.moves and record.result == UNFINISHED and not record.tags:
+            raise ValueError('No PDN game found')
+        return record
+
+    def replay(self, board_class=Board):
+        """
+        Generator playing the recorded moves on a new board from the starting position, yielding
+        (board, color, piece, move, skip) before each move is made. The board is changed in place
+        after each yield. Raises ValueError at the first move that isn't legal.
+        """
+        board = board_class()
+        color = RED
+        for index, (start, destination, capture) in enumerate(self.moves):
+            row, column = squarePosition(start)
+            piece = board.getPiece(row, column)
+            if piece == 0 or piece.color != color:
+                raise ValueError(f'Move {index + 1} ({self.moveText(index)}): no {"red" if color == RED else "white"} piece on square {start}')
+            move = squarePosition(destination)
+            skip = board.getValidMoves(piece).get(move)
+            if skip is None:
+                raise ValueError(f'Move {index + 1} ({self.moveText(index)}) is not legal')
+            yield board, color, piece, move, skip
+            board.make_move(piece, move[0], move[1], skip)
+            color = WHITE if color == RED else RED
+
+    def toBoard(self, board_class=Board):
+        """Method to return a board with every recorded move played on it"""
+        board = None
+        for board, color, piece, move, skip in self.replay(board_class):
+            pass # The last move is made on the same board once the generator runs out
+        return board if board is not None else board_class()
+
+def splitGames(lines):
+    """Generator yielding the PDN text of each game in a stream of lines, such as an open file, without reading the games"""
+    text = []
+    in_movetext = False
+    for line in lines:
+        stripped = line.strip()
+        if stripped.startswith('[') and in_movetext:
+            yield ''.join(text) # A new game's tags start after the last game's moves
+            text, in_movetext = [], False
+        if stripped and not stripped.startswith('['):
+            in_movetext = True
+        text.append(line if line.endswith('\n') else line + '\n')
+    if ''.join(text).strip():
+        yield ''.join(text)
+
+def readGames(lines):
+    """Generator yielding a GameRecord for each game in a stream of PDN lines"""
+    for text in splitGames(lines):
+        yield GameRecord.parse(text)
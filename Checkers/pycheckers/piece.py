@@ -1,6 +1,3 @@
-import pygame
-from .constants import RED, SQUARE_SIZE, WHITE, GREY, CROWN
-
 class Piece:
     """
     An uncrowned piece (man) moves one step diagonally 
@@ -14,8 +11,7 @@ class Piece:
     international draughts and Russian draughts, men can 
     jump both forwards and backwards.
     """
-    PADDING = 10
-    OUTLINE = 2
+    __slots__ = ('row', 'column', 'color', 'isKing') # Pieces are created for every board copy, so keep them small
 
     def __init__(self, row, column, color):
         """Method to initialize variables for Piece object"""
@@ -23,13 +19,6 @@ class Piece:
         self.column = column
         self.color = color
         self.isKing = False
-        self.x = 0
-        self.y = 0
-
-    def calculatePosition(self):
-        """Calculate te position of this piece based on the row and column it is in"""
-        self.x = SQUARE_SIZE * self.column + SQUARE_SIZE // 2
-        self.y = SQUARE_SIZE * self.row + SQUARE_SIZE // 2
     
     def makeKing(self):
         """
@@ -60,20 +49,10 @@ class Piece:
         """
         self.isKing = True
     
-    def draw(self, window):
-        """Method to draw this piece"""
-        self.calculatePosition() # https://stackoverflow.com/questions/65309004/plotting-pieces-on-a-checkerboard-using-pygame
-        radius = SQUARE_SIZE // 2 - self.PADDING
-        pygame.draw.circle(window, GREY, (self.x, self.y), radius + self.OUTLINE)
-        pygame.draw.circle(window, self.color, (self.x, self.y), radius)
-        if self.isKing:
-            window.blit(CROWN, (self.x - CROWN.get_width() // 2, self.y - CROWN.get_height() // 2))
-        
     def move(self, row, column):
         """Method to move piece to new position"""
         self.row = row
         self.column = column
-        self.calculatePosition()
 
     def __repr__(self):
         """Method to return string representation of piece object"""
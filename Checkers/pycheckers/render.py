@@ -0,0 +1,84 @@
+import os
+import pygame
+from .constants import BLACK, ROWS, COLUMNS, RED, SQUARE_SIZE, GREY, BLUE
+
+# Rendering is kept out of the rules modules so they can be used without pygame or a display
+PADDING = 10
+OUTLINE = 2
+CROWN_PATH = os.path.join(os.path.dirname(__file__), 'assets', 'crown.png') # Next to this module, so it loads whichever directory the game runs from
+_crown = None
+
+def getCrown():
+    """Function to load the crown image the first time a king is drawn"""
+    global _crown
+    if _crown is None:
+        _crown = pygame.transform.scale(pygame.image.load(CROWN_PATH), (45, 25))
+    return _crown
+
+def drawCheckerboardPattern(window):
+    """Function to draw squares in chequered pattern on board"""
+    window.fill(BLACK)
+    for row_index in range(ROWS):
+        for column_index in range(row_index % 2, COLUMNS, 2):
+            pygame.draw.rect(window, RED, (row_index * SQUARE_SIZE, column_index * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+
+def drawPiece(window, piece):
+    """Function to draw a piece in the middle of its square"""
+    x = SQUARE_SIZE * piece.column + SQUARE_SIZE // 2 # https://stackoverflow.com/questions/65309004/plotting-pieces-on-a-checkerboard-using-pygame
+    y = SQUARE_SIZE * piece.row + SQUARE_SIZE // 2
+    radius = SQUARE_SIZE // 2 - PADDING
+    pygame.draw.circle(window, GREY, (x, y), radius + OUTLINE)
+    pygame.draw.circle(window, piece.color, (x, y), radius)
+    if piece.isKing:
+        crown = getCrown()
+        window.blit(crown, (x - crown.get_width() // 2, y - crown.get_height() // 2))
+
+def drawValidMove(window, row, column):
+    """Function to draw the circle marking a square the selected piece can move to"""
+    pygame.draw.circle(window, BLUE, (column * SQUARE_SIZE + SQUARE_SIZE // 2, row * SQUARE_SIZE + SQUARE_SIZE // 2), 15)
+
+class BoardRenderer:
+    """
+    Class to draw a board by redrawing only the squares that changed
+    since the last frame. The checkerboard is drawn once to a cached
+    surface and copied back under each changed square, and only the
+    changed squares are sent to the display.
+    """
+    def __init__(self, window):
+        """Method to initialize renderer variables"""
+        self.window = window
+        self.background = pygame.Surface(window.get_size())
+        drawCheckerboardPattern(self.background)
+        self.invalidate()
+
+    def invalidate(self):
+        """Method to make the next draw redraw the whole window, e.g. after something else drew over it"""
+        self.squares = {} # (row, column): (color, isKing) of the piece drawn there or None, and whether it is marked as a valid move
+        self.last_frame = None
+
+    def draw(self, board, valid_moves):
+        """Method to bring the window up to date with the board and valid moves, returning the rects that changed"""
+        frame = (board.snapshot(), frozenset(valid_moves))
+        if frame == self.last_frame:
+            return [] # Nothing moved since the last frame
+        full = self.last_frame is None
+        self.last_frame = frame
+        if full:
+            self.window.blit(self.background, (0, 0))
+        rects = []
+        for row_index in range(ROWS):
+            for column_index in range(COLUMNS):
+                piece = board.getPiece(row_index, column_index)
+                square = (None if piece == 0 else (piece.color, piece.isKing), (row_index, column_index) in valid_moves)
+                if not full and self.squares.get((row_index, column_index)) == square:
+                    continue
+                self.squares[(row_index, column_index)] = square
+                rect = pygame.Rect(column_index * SQUARE_SIZE, row_index * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE)
+                if not full:
+                    self.window.blit(self.background, rect, rect)
+                    rects.append(rect)
+                if piece != 0:
+                    drawPiece(self.window, piece)
+                if square[1]:
+                    drawValidMove(self.window, row_index, column_index)
+        return [self.window.get_rect()] if full else rects
@@ -0,0 +1,34 @@
+import struct
+
+# The 32 dark squares are numbered row by row: square = row * 4 + column // 2
+SQUARES = 32
+SQUARE_POSITIONS = [(square // 4, 2 * (square % 4) + (square // 4 + 1) % 2) for square in range(SQUARES)]
+LAYOUT = struct.Struct('<6I') # red men, red kings, white men, white kings masks, then the red and white king counters
+
+class Snapshot(bytes):
+    """
+    Immutable 24-byte copy of a board's position: one 32-bit mask per
+    kind of piece plus the king counters the evaluation uses. The
+    counters go up every time a piece lands on a back row, kings
+    included, so they get a full 32 bits each rather than a byte. Snapshots
+    compare by value, hash, can be used as dictionary keys and pickle to
+    a few bytes, so they are cheap to keep or send to another process.
+    """
+    __slots__ = ()
+
+    @classmethod
+    def pack(cls, masks, red_kings, white_kings):
+        """Method to create a snapshot from the four masks and the king counters"""
+        return cls(LAYOUT.pack(*masks, red_kings, white_kings))
+
+    def masks(self):
+        """Method to return the red men, red kings, white men and white kings masks"""
+        return LAYOUT.unpack(self)[:4]
+
+    def kingCounters(self):
+        """Method to return the red and white king counters"""
+        return LAYOUT.unpack(self)[4:]
+
+    def __repr__(self):
+        """Method to return string representation of snapshot object"""
+        return f'Snapshot({self.hex()})'
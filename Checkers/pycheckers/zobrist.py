@@ -0,0 +1,32 @@
+import random
+from .constants import ROWS, COLUMNS, RED
+
+# Fixed seed so hashes are the same in every process and every run
+_random = random.Random(0x636865636B657273)
+
+# One key per square and piece type: red man, red king, white man, white king
+PIECE_KEYS = [[[_random.getrandbits(64) for piece_type in range(4)] for column in range(COLUMNS)] for row in range(ROWS)]
+# Board.evaluate scores the king counters, so they are part of the hash too (no key for a count of 0)
+KING_COUNT_KEYS = {color: [0] + [_random.getrandbits(64) for count in range(1, 32)] for color in ('red', 'white')}
+WHITE_TO_MOVE = _random.getrandbits(64)
+KING_COUNT_SEED = _random.getrandbits(64) # Drawn last so the keys above, and opening books hashed with them, don't change
+MASK_64 = (1 << 64) - 1
+
+def pieceKey(piece):
+    """Function to return the key for a piece on its current square"""
+    return PIECE_KEYS[piece.row][piece.column][(0 if piece.color == RED else 2) + piece.isKing]
+
+def _splitmix64(value):
+    """Function to scramble a 64-bit value into a well mixed one, the same way every run"""
+    value = (value + 0x9E3779B97F4A7C15) & MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & MASK_64
+    return value ^ (value >> 31)
+
+def kingCountKey(color, count):
+    """Function to return the key for a king counter value, a different key for every count"""
+    keys = KING_COUNT_KEYS['red' if color == RED else 'white']
+    if count < len(keys):
+        return keys[count]
+    # Counters have no upper limit, so counts past the table get keys computed from the count itself
+    return _splitmix64(KING_COUNT_SEED ^ (color != RED) << 32 ^ count)
@@ -0,0 +1,29 @@
+import random
+import pytest
+from pycheckers.board import Board
+from pycheckers.bitboard import BitBoard
+from pycheckers.constants import RED, WHITE
+from pycheckers.evaluation import mobility
+from CheckersAI.minimax.algorithm import get_all_move_tuples
+
+@pytest.mark.parametrize('board_class', [Board, BitBoard])
+def test_only_pieces_with_moves_are_movable(board_class):
+    board = board_class()
+    # Only the front row of each side can move from the starting position
+    assert [(piece.row, piece.column) for piece in board.get_movable_pieces(RED)] == [(5, 0), (5, 2), (5, 4), (5, 6)]
+    assert [(piece.row, piece.column) for piece in board.get_movable_pieces(WHITE)] == [(2, 1), (2, 3), (2, 5), (2, 7)]
+
+def test_mobility_is_the_same_on_both_backends():
+    rng = random.Random(4)
+    for game in range(10):
+        board, bitboard = Board(), BitBoard()
+        color = RED
+        for ply in range(120):
+            assert mobility(board) == mobility(bitboard)
+            moves = get_all_move_tuples(board, color)
+            if not moves or board.declareWinner() != None:
+                break
+            piece, move, skip = rng.choice(moves)
+            bitboard.make_move(bitboard.getPiece(piece.row, piece.column), move[0], move[1], [bitboard.getPiece(p.row, p.column) for p in skip])
+            board.make_move(piece, move[0], move[1], skip)
+            color = WHITE if color == RED else RED
@@ -0,0 +1,47 @@
+"""
+ParallelSearch splits the root moves over worker processes and must
+return the same value and move as the single-process search.
+"""
+import random
+import pytest
+from pycheckers.constants import RED, WHITE
+from pycheckers.bitboard import BitBoard
+from CheckersAI.minimax.algorithm import Search, apply_move, get_all_move_tuples
+from CheckersAI.minimax.parallel import ParallelSearch
+from CheckersAI.minimax.stats import SearchStats
+
+DEPTH = 3
+
+def randomPositions(count, seed=0):
+    """Function to return (board, color) pairs with moves left, reached by random moves from the start"""
+    rng = random.Random(seed)
+    positions = []
+    while len(positions) < count:
+        board, color = BitBoard(), RED
+        for ply in range(rng.randint(4, 40)):
+            moves = get_all_move_tuples(board, color)
+            if not moves or board.declareWinner() != None:
+                break
+            piece, move, skip = rng.choice(moves)
+            board.make_move(piece, move[0], move[1], skip)
+            color = WHITE if color == RED else RED
+        if get_all_move_tuples(board, color) and board.declareWinner() == None:
+            positions.append((board, color))
+    return positions
+
+@pytest.fixture(scope='module')
+def parallel():
+    parallel = ParallelSearch(2, quiescence=True, collect_stats=True)
+    yield parallel
+    parallel.shutdown()
+
+def test_quiescence_matches_single_process(parallel):
+    for board, color in randomPositions(8):
+        search = Search(quiescence=True, stats=SearchStats())
+        value, move, index = search.root(board, DEPTH, color == WHITE)
+        parallel_value, new_board, stats = parallel.search(board, DEPTH, color == WHITE)
+        assert parallel_value == value
+        assert new_board.snapshot() == apply_move(board, *move, None).snapshot()
+        assert stats['search'].quiescence_nodes > 0
+        assert stats['search'].depth == DEPTH
+        assert stats['nodes'] + 1 == stats['search'].nodes
@@ -0,0 +1,46 @@
+"""
+Tests for the headless AI server, fed JSON lines the way the stdin mode feeds them.
+"""
+import json
+import threading
+import pytest
+from pycheckers.board import Board
+from CheckersAI.minimax.server import AIServer
+
+START = Board().snapshot().hex()
+
+@pytest.fixture
+def server():
+    server = AIServer(workers=1, budget_ms=100, table_size=1 << 10)
+    yield server
+    server.shutdown()
+
+def serve(server, requests, timeout=30):
+    """Function to send requests to the server as JSON lines and return the reply dicts, failing if they don't all arrive in time"""
+    replies = []
+    lines = [request if isinstance(request, str) else json.dumps(request) for request in requests]
+    thread = threading.Thread(target=server.serveLines, args=(lines, lambda line: replies.append(json.loads(line))), daemon=True)
+    thread.start()
+    thread.join(timeout)
+    assert not thread.is_alive(), 'server stopped answering'
+    return replies
+
+def test_replaced_request(server):
+    # One worker is busy with the first games, so the first request for "g" is still queued when it is replaced
+    requests = [{'game': game, 'board': START, 'player': 'red'} for game in ('a', 'b', 'c', 'g', 'g')]
+    replies = serve(server, requests)
+    assert len(replies) == len(requests)
+    games = [reply for reply in replies if reply['game'] == 'g']
+    assert len(games) == 2
+    assert sum('move' in reply for reply in games) >= 1
+    assert all('move' in reply or reply['error'] == 'replaced by a newer request for this game' for reply in games)
+
+@pytest.mark.parametrize('game', [['g'], {'id': 1}, None, True])
+def test_invalid_game(server, game):
+    request = {'board': START, 'player': 'red'}
+    if game is not None:
+        request['game'] = game
+    replies = serve(server, [request, {'game': 1, 'board': START, 'player': 'red'}])
+    errors = [reply for reply in replies if 'error' in reply]
+    assert len(errors) == 1 and errors[0]['error'] == 'game must be a string or a number'
+    assert [reply['game'] for reply in replies if 'move' in reply] == [1]
@@ -0,0 +1,18 @@
+import pytest
+from pycheckers.board import Board
+from pycheckers.bitboard import BitBoard
+from pycheckers.snapshot import Snapshot, LAYOUT
+
+@pytest.mark.parametrize('board_class', [Board, BitBoard])
+@pytest.mark.parametrize('counters', [(0, 0), (255, 256), (300, 70000)])
+def test_snapshot_keeps_large_king_counters(board_class, counters):
+    # Kings moving along the back rows keep adding to the counters, long endgames take them past a byte
+    board = board_class.fromMasks(0, 1 << 28, 0, 1 << 3, *counters)
+    snapshot = board.snapshot()
+    assert len(snapshot) == LAYOUT.size
+    assert snapshot.kingCounters() == counters
+    copy = board_class.fromSnapshot(Snapshot(bytes.fromhex(snapshot.hex())))
+    assert (copy.red_kings, copy.white_kings) == counters
+    assert copy.masks() == board.masks()
+    assert copy.hash == board.hash
+    assert board.copy().snapshot() == snapshot
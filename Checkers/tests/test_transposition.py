@@ -0,0 +1,13 @@
+from pycheckers.bitboard import BitBoard
+from CheckersAI.benchmark import runSelfPlay
+
+def test_selfplay_reports_table_counters():
+    report = runSelfPlay(BitBoard, 2, 3, 4, 0, 1 << 10)
+    table = report['table']
+    assert table['hits'] > 0 and table['misses'] > 0
+    assert table['hit_rate'] == table['hits'] / (table['hits'] + table['misses'])
+    for name in ('hits', 'misses', 'stores', 'overwrites'):
+        assert table[name] == sum(game['table'][name] for game in report['per_game'])
+
+def test_selfplay_without_table():
+    assert 'table' not in runSelfPlay(BitBoard, 1, 2, 4, 0, 0)
@@ -0,0 +1,116 @@
+"""
+CheckersGame and CheckersAI both play on the shared pycheckers engine,
+with either the Board or the BitBoard backend. These tests check
+hand-worked moves on both backends and that every combination plays
+the same game as the original CheckersGame.
+
+Run them from the Checkers directory with python -m pytest tests
+"""
+import random
+import pygame
+import pytest
+from pycheckers.constants import WIDTH, HEIGHT, RED, WHITE
+from pycheckers.board import Board
+from pycheckers.bitboard import BitBoard
+from pycheckers.game import Game
+from CheckersAI.benchmark import perft
+from CheckersAI.minimax.algorithm import get_all_move_tuples
+
+BOARDS = [Board, BitBoard]
+PERFT = [7, 49, 379, 2872, 23582] # Positions reachable from the start in 1 to 5 moves, red moving first
+
+# A human-vs-human game clicked through Game.select, two digits (row, column) per click, including stray clicks.
+# The final position and winner were recorded by playing these clicks on the original CheckersGame package.
+SCRIPTED_CLICKS = ('544521326554273645271021564523344523123454433254632314325041663250726350726756725474635472'
+                   '105241253470616272504132214356474354766554764736613443633625163427160725')
+SCRIPTED_POSITION = ['.w.w.w..', '........', '.....w..', '....w...', '...w....', 'W.......', '........', '......W.']
+SCRIPTED_WINNER = WHITE
+
+def describeMoves(board, color):
+    """Function to return a side's moves as plain squares, so moves on different boards can be compared"""
+    return [((piece.row, piece.column), move, [(skipped.row, skipped.column) for skipped in skip])
+            for piece, move, skip in get_all_move_tuples(board, color)]
+
+def describeBoard(board):
+    """Function to return the board as one string per row: r/w for men, R/W for kings and . for empty squares"""
+    rows = []
+    for row in board.board:
+        rows.append(''.join('.' if piece == 0 else ('w' if piece.color == WHITE else 'r').upper() if piece.isKing
+                            else ('w' if piece.color == WHITE else 'r') for piece in row))
+    return rows
+
+def boardWith(board_class, red_men=(), red_kings=(), white_men=(), white_kings=()):
+    """Function to return a board holding only the pieces on the given (row, column) squares"""
+    masks = [sum(1 << (row * 4 + column // 2) for row, column in squares) for squares in (red_men, red_kings, white_men, white_kings)]
+    return board_class.fromMasks(*masks)
+
+def movesOf(board, row, column):
+    """Function to return a piece's moves as {destination: [jumped squares]}"""
+    return {move: [(skipped.row, skipped.column) for skipped in skip] for move, skip in board.getValidMoves(board.getPiece(row, column)).items()}
+
+@pytest.mark.parametrize('board_class', BOARDS)
+def test_moves_from_start(board_class):
+    # Only red's front row can move, each man one square diagonally forward
+    assert describeMoves(board_class(), RED) == [
+        ((5, 0), (4, 1), []),
+        ((5, 2), (4, 1), []), ((5, 2), (4, 3), []),
+        ((5, 4), (4, 3), []), ((5, 4), (4, 5), []),
+        ((5, 6), (4, 5), []), ((5, 6), (4, 7), []),
+    ]
+
+@pytest.mark.parametrize('board_class', BOARDS)
+def test_jumps(board_class):
+    board = boardWith(board_class, red_men=[(5, 2)], white_men=[(4, 3)])
+    assert movesOf(board, 5, 2) == {(4, 1): [], (3, 4): [(4, 3)]}
+    # A jump goes on over a second piece, listing the last piece jumped first
+    board = boardWith(board_class, red_men=[(5, 0)], white_men=[(4, 1), (2, 3)])
+    assert movesOf(board, 5, 0) == {(3, 2): [(4, 1)], (1, 4): [(2, 3), (4, 1)]}
+    # Men can't jump backwards, kings can
+    board = boardWith(board_class, red_men=[(3, 2)], white_men=[(4, 3)])
+    assert movesOf(board, 3, 2) == {(2, 1): [], (2, 3): []}
+    board = boardWith(board_class, red_kings=[(3, 2)], white_men=[(4, 3)])
+    assert movesOf(board, 3, 2) == {(2, 1): [], (2, 3): [], (4, 1): [], (5, 4): [(4, 3)]}
+
+@pytest.mark.parametrize('board_class', BOARDS)
+def test_crowning(board_class):
+    board = boardWith(board_class, red_men=[(1, 2)], white_men=[(6, 1)])
+    piece = board.getPiece(1, 2)
+    undo = board.make_move(piece, 0, 1, [])
+    assert piece.isKing and board.red_kings == 1
+    assert describeMoves(board, RED) == [((0, 1), (1, 0), []), ((0, 1), (1, 2), [])]
+    board.undo_move(undo)
+    assert not piece.isKing and board.red_kings == 0
+    assert describeMoves(board, RED) == [((1, 2), (0, 1), []), ((1, 2), (0, 3), [])]
+
+@pytest.mark.parametrize('board_class', BOARDS)
+def test_perft(board_class):
+    assert [perft(board_class(), depth, RED) for depth in range(1, len(PERFT) + 1)] == PERFT
+
+@pytest.mark.parametrize('seed', range(20))
+def test_same_moves_along_games(seed):
+    rng = random.Random(seed)
+    board, bitboard = Board(), BitBoard()
+    color = RED
+    for ply in range(200):
+        moves = describeMoves(board, color)
+        assert describeMoves(bitboard, color) == moves
+        for current in (board, bitboard):
+            captures = [((piece.row, piece.column), move, [(skipped.row, skipped.column) for skipped in skip])
+                        for piece, move, skip in current.get_capture_tuples(color)]
+            assert captures == [move for move in moves if move[2]]
+        if not moves or board.declareWinner() != None:
+            break
+        start, destination, skipped = rng.choice(moves)
+        for current in (board, bitboard):
+            skip = [current.getPiece(*square) for square in skipped]
+            current.make_move(current.getPiece(*start), destination[0], destination[1], skip)
+        assert bitboard.snapshot() == board.snapshot()
+        color = WHITE if color == RED else RED
+
+@pytest.mark.parametrize('board_class', BOARDS)
+def test_scripted_game_matches_original_game(board_class):
+    game = Game(pygame.Surface((WIDTH, HEIGHT)), board_class)
+    for index in range(0, len(SCRIPTED_CLICKS), 2):
+        game.select(int(SCRIPTED_CLICKS[index]), int(SCRIPTED_CLICKS[index + 1]))
+    assert describeBoard(game.board) == SCRIPTED_POSITION
+    assert game.winner() == SCRIPTED_WINNER
@@ -0,0 +1,14 @@
+from pycheckers.board import Board
+from pycheckers.constants import RED, WHITE
+from pycheckers.zobrist import kingCountKey
+
+def test_every_king_count_has_its_own_key():
+    keys = [kingCountKey(color, count) for color in (RED, WHITE) for count in range(1, 2000)]
+    assert len(set(keys)) == len(keys)
+    assert kingCountKey(RED, 0) == kingCountKey(WHITE, 0) == 0
+
+def test_positions_differing_only_in_king_counter_hash_differently():
+    # Board.evaluate scores the counters, so a transposition table must not mix these positions up
+    masks = (0, 1 << 28, 0, 1 << 3)
+    hashes = {Board.fromMasks(*masks, count, 1).hash for count in (1, 33, 65)}
+    assert len(hashes) == 3
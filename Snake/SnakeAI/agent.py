@@ -1,8 +1,9 @@
 import torch
 import random
 import numpy as np
-from collections import deque
 from snakeai import SnakeGameAI, Direction, Point, BLOCK_SIZE
+from vecsnakeai import VecSnakeGameAI
+from memory import ReplayMemory
 from model import Linear_QNet, QTrainer
 from utils import plot
 
@@ -10,13 +11,15 @@ from utils import plot
 MAX_MEMORY = 100_000
 BATCH_SIZE = 1000
 LEARNING_RATE = 0.001
+RENDER_EVERY = 50 # Show every 50th game and update the plot, the others are played without a window at full speed. 0 never shows a game
+VECTORIZED_GAMES = 64 # Games stepped together by train_vectorized
 
 class Agent:
     def __init__(self):
         self.number_of_games = 0
         self.epsilon = 0 # randomness
         self.discount_rate = 0 
-        self.memory = deque(maxlen=MAX_MEMORY) # If we exceed max memory it will automatically call popleft()
+        self.memory = ReplayMemory(MAX_MEMORY, 11, 3) # If we exceed max memory the oldest transitions are overwritten
         self.model = Linear_QNet(11, 256, 3)
         self.trainer = QTrainer(self.model, LEARNING_RATE, self.discount_rate)
 
@@ -67,15 +70,15 @@ class Agent:
         return np.array(state, dtype=int) # Convert list to numpy array and set data type as int
 
     def remember(self, state, action, reward, next_state, game_over):
-        self.memory.append((state, action, reward, next_state, game_over)) # popleft automatically if MAX_MEMORY reached
+        self.memory.append(state, action, reward, next_state, game_over) # overwrites the oldest if MAX_MEMORY reached
+
+    def remember_batch(self, states, actions, rewards, next_states, game_overs):
+        """Method to remember one transition per row of the given arrays"""
+        self.memory.extend(states, actions, rewards, next_states, game_overs)
          
     def train_long_memory(self):
-        if len(self.memory) > BATCH_SIZE:
-            # Generate random sample
-            mini_sample = random.sample(self.memory, BATCH_SIZE) # list of tuples of size BATCH_SIZE
-        else:
-            mini_sample = self.memory
-        states, actions, rewards, next_states, game_overs = zip(*mini_sample)
+        # Random sample of BATCH_SIZE transitions, or all of them while there are fewer, as one array per field
+        states, actions, rewards, next_states, game_overs = self.memory.sample(BATCH_SIZE)
         self.trainer.train_step(states, actions, rewards, next_states, game_overs)
 
     def train_short_memory(self, state, action, reward, next_state, game_over):
@@ -99,13 +102,24 @@ class Agent:
             final_move[move_index] = 1
         return final_move
 
-def train():
+    def get_actions(self, states):
+        """Method to pick a move for each of a batch of states, exploring as get_action does but with one forward pass for the whole batch"""
+        self.epsilon = 80 - self.number_of_games
+        with torch.no_grad():
+            move_indices = torch.argmax(self.model(torch.tensor(states, dtype=torch.float)), dim=1).numpy()
+        explore = np.random.randint(0, 201, len(states)) < self.epsilon
+        move_indices[explore] = np.random.randint(0, 3, explore.sum())
+        final_moves = np.zeros((len(states), 3), dtype=int)
+        final_moves[np.arange(len(states)), move_indices] = 1
+        return final_moves
+
+def train(render_every=RENDER_EVERY):
     plot_scores = []
     plot_mean_scores = []
     total_score = 0
     best_score = 0
     agent = Agent()
-    game = SnakeGameAI()
+    game = SnakeGameAI(render=render_every == 1)
     while True:
         # Get current state
         current_state = agent.get_state(game)
@@ -132,7 +146,40 @@ def train():
             total_score += score
             mean_score = total_score / agent.number_of_games
             plot_mean_scores.append(mean_score)
-            plot(plot_scores, plot_mean_scores)
+            if render_every and agent.number_of_games % render_every == 0:
+                plot(plot_scores, plot_mean_scores) # Plotting pauses for a tenth of a second, too long to do after every game
+            game.render = bool(render_every) and (agent.number_of_games + 1) % render_every == 0
+
+def train_vectorized(number_of_games=VECTORIZED_GAMES, plot_every=RENDER_EVERY):
+    """Function to train on a batch of games stepped together in NumPy, none of them drawn"""
+    plot_scores = []
+    plot_mean_scores = []
+    total_score = 0
+    best_score = 0
+    agent = Agent()
+    games = VecSnakeGameAI(number_of_games)
+    current_states = games.get_states()
+    while True:
+        # Get a move for every game and play them all at once
+        final_moves = agent.get_actions(current_states)
+        new_states, rewards, game_overs, scores = games.step(final_moves)
+        # Train short memory on the whole batch, new states of finished games are already their next game's but are never used
+        agent.train_short_memory(current_states, final_moves, rewards, new_states, game_overs)
+        agent.remember_batch(current_states, final_moves, rewards, new_states, game_overs)
+        for score in scores[game_overs]:
+            agent.number_of_games += 1
+            if score > best_score:
+                best_score = score
+                agent.model.save()
+            print('Game', agent.number_of_games, 'Score', score, 'High Score:', best_score)
+            plot_scores.append(score)
+            total_score += score
+            plot_mean_scores.append(total_score / agent.number_of_games)
+            if plot_every and agent.number_of_games % plot_every == 0:
+                plot(plot_scores, plot_mean_scores)
+        if game_overs.any():
+            agent.train_long_memory()
+        current_states = new_states
 
 if __name__ == '__main__':
     train()
\ No newline at end of file
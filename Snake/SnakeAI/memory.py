@@ -0,0 +1,58 @@
+import numpy as np
+
+class ReplayMemory:
+    """
+    Class to remember the last capacity transitions for experience replay.
+    Every field is one preallocated NumPy array used as a ring buffer, so
+    remembering a transition is a few array writes, the oldest transition
+    is overwritten once the memory is full and a sampled batch comes out
+    as contiguous arrays that torch.as_tensor can use without copying.
+    """
+    def __init__(self, capacity, state_size, action_size, seed=None):
+        self.capacity = capacity
+        self.states = np.zeros((capacity, state_size), dtype=np.float32)
+        self.actions = np.zeros((capacity, action_size), dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros((capacity, state_size), dtype=np.float32)
+        self.game_overs = np.zeros(capacity, dtype=bool)
+        self.index = 0 # Slot the next transition is written to
+        self.size = 0
+        self.random = np.random.default_rng(seed)
+
+    def __len__(self):
+        return self.size
+
+    def append(self, state, action, reward, next_state, game_over):
+        """Method to remember one transition, overwriting the oldest once the memory is full"""
+        self.states[self.index] = state
+        self.actions[self.index] = action
+        self.rewards[self.index] = reward
+        self.next_states[self.index] = next_state
+        self.game_overs[self.index] = game_over
+        self.index = (self.index + 1) % self.capacity
+        self.size = min(self.size + 1, self.capacity)
+
+    def extend(self, states, actions, rewards, next_states, game_overs):
+        """Method to remember a batch of transitions given as arrays with one row per transition"""
+        count = min(len(states), self.capacity) # Only the newest capacity transitions of a huge batch would be kept anyway
+        slots = (self.index + np.arange(count)) % self.capacity
+        self.states[slots] = states[-count:]
+        self.actions[slots] = actions[-count:]
+        self.rewards[slots] = rewards[-count:]
+        self.next_states[slots] = next_states[-count:]
+        self.game_overs[slots] = game_overs[-count:]
+        self.index = (self.index + count) % self.capacity
+        self.size = min(self.size + count, self.capacity)
+
+    def sample(self, batch_size):
+        """
+        Method to return (states, actions, rewards, next_states, game_overs) arrays for
+        batch_size different transitions picked at random, or for every transition
+        remembered if there are no more than batch_size
+        """
+        if self.size > batch_size:
+            indices = self.random.choice(self.size, batch_size, replace=False)
+        else:
+            indices = np.arange(self.size)
+        return (self.states[indices], self.actions[indices], self.rewards[indices],
+                self.next_states[indices], self.game_overs[indices])
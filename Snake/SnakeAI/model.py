@@ -32,11 +32,11 @@ class QTrainer:
         self.criterion = nn.MSELoss()
 
     def train_step(self, current_state, action, reward, new_state, game_over):
-        # Convert parameters to pytorch tensors
-        current_state = torch.tensor(current_state, dtype=torch.float)
-        new_state = torch.tensor(new_state, dtype=torch.float)
-        action = torch.tensor(action, dtype=torch.long)
-        reward = torch.tensor(reward, dtype=torch.float)
+        # Convert parameters to pytorch tensors, as_tensor shares the memory of NumPy arrays that already have the right type
+        current_state = torch.as_tensor(current_state, dtype=torch.float)
+        new_state = torch.as_tensor(new_state, dtype=torch.float)
+        action = torch.as_tensor(action, dtype=torch.long)
+        reward = torch.as_tensor(reward, dtype=torch.float)
         # Handle parameters of varying length
         if len(current_state.shape) == 1:
             # Single value: (1, x), Multiple values: (n, x)
@@ -45,18 +45,23 @@ class QTrainer:
             action = torch.unsqueeze(action, 0)
             reward = torch.unsqueeze(reward, 0)
             game_over = (game_over, ) # Creates a tuple with a single element, without the comma this would be converted to a string
+        game_over = torch.as_tensor(game_over, dtype=torch.bool)
         # 1. Predicted Q values with current state
         prediction = self.model(current_state)
-        target = prediction.clone()
-        for index in range(len(game_over)):
-            Q_new = reward[index]
-            if not game_over[index]:
-                Q_new = reward[index] + self.discount_rate * torch.max(self.model(new_state[index]))
-            target[index][torch.argmax(action).item()] = Q_new
-        # 2. q_new = reward + discount_rate * max(next_predicted_q_value) -> only do this if not game_over
-        # prediction.clone()
-        # predictions[argmax(action)] = q_new
+        target = self.get_target(prediction, action, reward, new_state, game_over)
         self.optimizer.zero_grad()
         loss = self.criterion(target, prediction)
         loss.backward()
-        self.optimizer.step()
\ No newline at end of file
+        self.optimizer.step()
+
+    def get_target(self, prediction, action, reward, new_state, game_over):
+        """Method to return the Q value targets for a batch of predictions, all arguments are tensors with one row per sample"""
+        # 2. q_new = reward + discount_rate * max(next_predicted_q_value) -> only do this if not game_over
+        # One forward pass for the whole batch, the next state's values are the target so no gradient goes through them
+        with torch.no_grad():
+            next_q = torch.max(self.model(new_state), dim=1).values
+        Q_new = torch.where(game_over, reward, reward + self.discount_rate * next_q)
+        # 3. targets[argmax(action)] = q_new for each sample, the other actions keep their prediction so their error is 0
+        target = prediction.detach().clone()
+        target[torch.arange(len(target)), torch.argmax(action, dim=1)] = Q_new
+        return target
@@ -1,7 +1,7 @@
 import pygame
 import random
 from enum import Enum
-from collections import namedtuple
+from collections import namedtuple, deque
 import numpy as np
 
 pygame.init()
@@ -33,23 +33,30 @@ SPEED = 20
 
 class SnakeGameAI:
     
-    def __init__(self, w=640, h=480):
+    def __init__(self, w=640, h=480, render=True, speed=SPEED):
         self.w = w
         self.h = h
-        # init display
-        self.display = pygame.display.set_mode((self.w, self.h))
-        pygame.display.set_caption('Snake')
+        # render can be switched on and off between steps, the window is only created the first time a step is drawn
+        # speed caps steps per second while rendering, None runs as fast as possible
+        self.render = render
+        self.speed = speed
+        self.display = None
         self.clock = pygame.time.Clock()
         self.reset()
+
+    def _init_display(self):
+        self.display = pygame.display.set_mode((self.w, self.h))
+        pygame.display.set_caption('Snake')
         
     def reset(self):
         # init game state
         self.direction = Direction.RIGHT
         
         self.head = Point(self.w/2, self.h/2)
-        self.snake = [self.head, 
-                      Point(self.head.x-BLOCK_SIZE, self.head.y),
-                      Point(self.head.x-(2*BLOCK_SIZE), self.head.y)]
+        self.snake = deque([self.head, 
+                            Point(self.head.x-BLOCK_SIZE, self.head.y),
+                            Point(self.head.x-(2*BLOCK_SIZE), self.head.y)])
+        self.body = set(self.snake) - {self.head} # Points of the snake behind its head, so collision checks don't scan the snake
         
         self.score = 0
         self.food = None
@@ -57,23 +64,27 @@ class SnakeGameAI:
         self.frame_iteration = 0
 
     def _place_food(self):
-        x = random.randint(0, (self.w-BLOCK_SIZE )//BLOCK_SIZE )*BLOCK_SIZE 
-        y = random.randint(0, (self.h-BLOCK_SIZE )//BLOCK_SIZE )*BLOCK_SIZE
-        self.food = Point(x, y)
-        if self.food in self.snake:
-            self._place_food()
+        while True:
+            x = random.randint(0, (self.w-BLOCK_SIZE )//BLOCK_SIZE )*BLOCK_SIZE 
+            y = random.randint(0, (self.h-BLOCK_SIZE )//BLOCK_SIZE )*BLOCK_SIZE
+            self.food = Point(x, y)
+            if self.food != self.head and self.food not in self.body:
+                break
         
     def play_step(self, action):
         self.frame_iteration += 1
-        # 1. collect user input
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                pygame.quit()
-                quit()
+        # 1. collect user input, there is no window to send any before the first rendered step
+        # Once the window exists its events are read every step, rendered or not, so the OS doesn't mark it as not responding
+        if self.display is not None:
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    pygame.quit()
+                    quit()
         
         # 2. move
+        self.body.add(self.head) # the old head becomes part of the body
         self._move(action) # update the head
-        self.snake.insert(0, self.head)
+        self.snake.appendleft(self.head)
         
         # 3. check if game over
         reward = 0
@@ -89,11 +100,13 @@ class SnakeGameAI:
             reward = 10
             self._place_food()
         else:
-            self.snake.pop()
+            self.body.discard(self.snake.pop())
         
-        # 5. update ui and clock
-        self._update_ui()
-        self.clock.tick(SPEED)
+        # 5. update ui and clock, skipped entirely when training without a window
+        if self.render:
+            self._update_ui()
+            if self.speed:
+                self.clock.tick(self.speed)
         # 6. return game over and score
         return reward, game_over, self.score
     
@@ -104,12 +117,14 @@ class SnakeGameAI:
         if point.x > self.w - BLOCK_SIZE or point.x < 0 or point.y > self.h - BLOCK_SIZE or point.y < 0:
             return True
         # hits itself
-        if point in self.snake[1:]:
+        if point in self.body:
             return True
         
         return False
         
     def _update_ui(self):
+        if self.display is None:
+            self._init_display()
         self.display.fill(BLACK)
         
         for pt in self.snake:
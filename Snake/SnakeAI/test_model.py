@@ -0,0 +1,66 @@
+"""
+Tests for the Q-learning trainer. Run them from the SnakeAI directory with
+
+    python -m pytest test_model.py
+"""
+import numpy as np
+import pytest
+import torch
+from model import Linear_QNet, QTrainer
+
+STATE_SIZE, HIDDEN_SIZE, ACTION_SIZE = 11, 32, 3
+
+def make_trainer(seed=0):
+    """Function to return a trainer with a small model whose weights depend only on seed"""
+    torch.manual_seed(seed)
+    return QTrainer(Linear_QNet(STATE_SIZE, HIDDEN_SIZE, ACTION_SIZE), 0.001, 0.9)
+
+def make_batch(size, seed=0):
+    """Function to return a batch of transitions with every action and a mix of game_over flags"""
+    rng = np.random.default_rng(seed)
+    states = rng.integers(0, 2, (size, STATE_SIZE)).astype(np.float32)
+    actions = np.eye(ACTION_SIZE, dtype=np.int64)[np.arange(size) % ACTION_SIZE]
+    rewards = rng.choice([-10.0, 0.0, 10.0], size).astype(np.float32)
+    next_states = rng.integers(0, 2, (size, STATE_SIZE)).astype(np.float32)
+    game_overs = np.arange(size) % 2 == 0
+    return states, actions, rewards, next_states, game_overs
+
+def loop_target(trainer, prediction, action, reward, new_state, game_over):
+    """Function to compute the targets one sample at a time, each with the argmax of its own action"""
+    target = prediction.detach().clone()
+    for index in range(len(game_over)):
+        Q_new = reward[index]
+        if not game_over[index]:
+            Q_new = reward[index] + trainer.discount_rate * torch.max(trainer.model(new_state[index]))
+        target[index][torch.argmax(action[index]).item()] = Q_new
+    return target
+
+@pytest.mark.parametrize('size', [1, 2, 7])
+def test_target_matches_loop(size):
+    trainer = make_trainer()
+    states, actions, rewards, next_states, game_overs = (torch.as_tensor(field) for field in make_batch(size))
+    prediction = trainer.model(states)
+    target = trainer.get_target(prediction, actions, rewards, next_states, game_overs)
+    assert torch.allclose(target, loop_target(trainer, prediction, actions, rewards, next_states, game_overs))
+
+def test_train_step_single_and_batch():
+    trainer = make_trainer()
+    states, actions, rewards, next_states, game_overs = make_batch(6)
+    before = [parameter.detach().clone() for parameter in trainer.model.parameters()]
+    trainer.train_step(states[0], actions[0], rewards[0], next_states[0], bool(game_overs[0]))
+    trainer.train_step(states, actions, rewards, next_states, game_overs)
+    assert any(not torch.equal(old, new) for old, new in zip(before, trainer.model.parameters()))
+
+def test_agent_training():
+    pytest.importorskip('matplotlib')
+    pytest.importorskip('IPython')
+    from agent import Agent
+    agent = Agent()
+    states, actions, rewards, next_states, game_overs = make_batch(5)
+    agent.train_short_memory(states[0], actions[0], rewards[0], next_states[0], bool(game_overs[0]))
+    agent.train_short_memory(states, actions, rewards, next_states, game_overs)
+    agent.remember_batch(states, actions, rewards, next_states, game_overs)
+    assert len(agent.memory) == 5
+    before = [parameter.detach().clone() for parameter in agent.model.parameters()]
+    agent.train_long_memory()
+    assert any(not torch.equal(old, new) for old, new in zip(before, agent.model.parameters()))
@@ -0,0 +1,136 @@
+import numpy as np
+from snakeai import BLOCK_SIZE
+
+# Directions in clockwise order, the same order SnakeGameAI._move turns through
+RIGHT, DOWN, LEFT, UP = range(4)
+TURNS = np.array([0, 1, -1]) # [straight, right, left] added to the direction index
+
+class VecSnakeGameAI:
+    """
+    Class holding a batch of Snake games as NumPy arrays and stepping
+    them all in one call. The rules, rewards and the 11-value states
+    are the same as SnakeGameAI's and Agent.get_state's, but games are
+    played on a grid of cells rather than pixels and are never drawn.
+
+    Each board is stored flat with a one cell wall around it, so a
+    cell is y * stride + x and a collision is a single lookup in the
+    occupancy grid. The snake bodies are ring buffers of cells, the
+    head being the newest entry, so moving only writes the new head
+    and clears the old tail.
+    """
+    def __init__(self, number_of_games, w=640, h=480, seed=None):
+        self.number_of_games = number_of_games
+        self.columns = w // BLOCK_SIZE
+        self.rows = h // BLOCK_SIZE
+        self.stride = self.columns + 2
+        self.capacity = self.columns * self.rows # Longest a snake can get
+        self.random = np.random.default_rng(seed)
+        self.deltas = np.array([1, self.stride, -1, -self.stride]) # Cell offset of one step RIGHT, DOWN, LEFT, UP
+        self.walls = np.ones((self.rows + 2, self.stride), dtype=bool)
+        self.walls[1:-1, 1:-1] = False
+        self.walls = self.walls.ravel()
+        self.games = np.arange(number_of_games)
+        self.grid = np.empty((number_of_games, self.walls.size), dtype=bool) # Occupied by a wall or the snake
+        self.body = np.zeros((number_of_games, self.capacity), dtype=np.int64) # Ring buffer of body cells
+        self.head_index = np.zeros(number_of_games, dtype=np.int64) # Slot of the head in body
+        self.length = np.zeros(number_of_games, dtype=np.int64)
+        self.head = np.zeros(number_of_games, dtype=np.int64)
+        self.direction = np.zeros(number_of_games, dtype=np.int64)
+        self.food = np.zeros(number_of_games, dtype=np.int64)
+        self.score = np.zeros(number_of_games, dtype=np.int64)
+        self.frame_iteration = np.zeros(number_of_games, dtype=np.int64)
+        self.reset()
+
+    def cell(self, x, y):
+        """Method to return the cell of grid coordinates x, y"""
+        return (y + 1) * self.stride + x + 1
+
+    def reset(self, games=None):
+        """Method to start new games, every game or only those in an index array or boolean mask"""
+        games = self.games if games is None else self.games[games]
+        if len(games) == 0:
+            return
+        head = self.cell(self.columns // 2, self.rows // 2)
+        self.grid[games] = self.walls
+        self.body[games, :3] = [head - 2, head - 1, head] # Tail first, as the head is the newest entry
+        self.grid[games[:, None], self.body[games, :3]] = True
+        self.head_index[games] = 2
+        self.length[games] = 3
+        self.head[games] = head
+        self.direction[games] = RIGHT
+        self.score[games] = 0
+        self.frame_iteration[games] = 0
+        self._place_food(games)
+
+    def _place_food(self, games):
+        # Pick random cells until every game has its food on an empty one, as SnakeGameAI does
+        games = games[self.length[games] < self.capacity] # A snake filling its board leaves nowhere to put food
+        while len(games):
+            x = self.random.integers(0, self.columns, len(games))
+            y = self.random.integers(0, self.rows, len(games))
+            self.food[games] = self.cell(x, y)
+            games = games[self.grid[games, self.food[games]]]
+
+    def get_states(self):
+        """Method to return the (number_of_games, 11) states in Agent.get_state's layout"""
+        last = self.walls.size - 1
+        def danger(direction):
+            # Cells past the wall are clipped back onto it, they can only be looked at after a game is over
+            return self.grid[self.games, np.clip(self.head + self.deltas[direction], 0, last)]
+        head_x, head_y = self.head % self.stride, self.head // self.stride
+        food_x, food_y = self.food % self.stride, self.food // self.stride
+        return np.stack([
+            danger(self.direction), # Danger straight/ahead
+            danger((self.direction + 1) % 4), # Danger right
+            danger((self.direction - 1) % 4), # Danger left
+            self.direction == LEFT,
+            self.direction == RIGHT,
+            self.direction == UP,
+            self.direction == DOWN,
+            food_x < head_x, # Food left
+            food_x > head_x, # Food right
+            food_y < head_y, # Food up
+            food_y > head_y, # Food down
+        ], axis=1).astype(int)
+
+    def step(self, actions):
+        """
+        Method to play one move in every game, actions being (number_of_games, 3) one-hot
+        [straight, right, left] rows or (number_of_games,) indices into them. Returns the
+        states, rewards, game over flags and scores after the move. Finished games are
+        started again, so their state is already that of the new game; their score is the
+        one they finished with.
+        """
+        actions = np.asarray(actions)
+        if actions.ndim == 2:
+            actions = actions.argmax(axis=1)
+        self.frame_iteration += 1
+        self.direction = (self.direction + TURNS[actions]) % 4
+        self.head = self.head + self.deltas[self.direction]
+        # The tail hasn't moved out of the way yet, so running into it ends the game too
+        collided = self.grid[self.games, self.head]
+        game_over = collided | (self.frame_iteration > 100 * (self.length + 1))
+        alive = self.games[~game_over]
+        rewards = np.where(game_over, -10, 0)
+
+        self.head_index[alive] = (self.head_index[alive] + 1) % self.capacity
+        self.body[alive, self.head_index[alive]] = self.head[alive]
+        self.grid[alive, self.head[alive]] = True
+        ate = np.zeros(self.number_of_games, dtype=bool)
+        ate[alive] = self.head[alive] == self.food[alive]
+        moved = alive[~ate[alive]]
+        tail = self.body[moved, (self.head_index[moved] - self.length[moved]) % self.capacity]
+        self.grid[moved, tail] = False
+        eaten = self.games[ate]
+        self.length[eaten] += 1
+        self.score[eaten] += 1
+        rewards[eaten] = 10
+        self._place_food(eaten)
+
+        states = self.get_states()
+        scores = self.score.copy()
+        finished = self.games[game_over]
+        if len(finished):
+            self.reset(finished)
+            states[finished] = self.get_states()[finished]
+        return states, rewards, game_over, scores